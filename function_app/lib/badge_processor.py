@@ -17,7 +17,7 @@ else:
     # Local dev fallback - src/ is in project root
     sys.path.insert(0, str(_function_dir.parent))
 
-from src.utils.paths import get_mocks_dir, get_working_dir
+from src.utils.paths import mocks_path, get_working_dir
 from src.models import Event, Attendee, EventAttendee
 from src.renderers.badge_renderer_html import BadgeRendererHTML
 from scripts.generate_ai_prompts import (
@@ -163,7 +163,7 @@ class BadgeProcessor:
         """Load event configuration from JSON file"""
         import json
 
-        events_path = get_mocks_dir() / "events.json"
+        events_path = mocks_path("events.json")
         with open(events_path, 'r') as f:
             events = json.load(f)
 
@@ -65,6 +65,9 @@ def main():
     errors = 0
     generated_paths = []
 
+    # (event, attendee, event_attendee, badge_pdf_path, output_path) per rendered badge
+    sheet_jobs = []
+
     # Iterate through event-attendee combinations
     for event_id, ea_list in sorted(event_attendees.items()):
         if event_id not in events:
@@ -73,6 +76,23 @@ def main():
 
         event = events[event_id]
 
+        # Badge renderer arguments for this event; each worker process builds its own renderer
+        init_kwargs = dict(
+            template_dir=ROOT / "config" / "html_templates" / "professional",
+            event_id=event_id,
+            event_name=event.display_name,
+            event_date=event.date,
+            sponsor=event.sponsor,
+            event_logo_path=event.logo_path,
+            sponsor_logo_path=event.sponsor_logo_path,
+            tags=event.tags
+        )
+
+        badge_output_dir = ROOT / "output" / "badges" / event_id
+        badge_output_dir.mkdir(parents=True, exist_ok=True)
+
+        badge_jobs = []
+        pending = []
         for ea_dict in ea_list:
             user_id = ea_dict["user_id"]
 
@@ -83,55 +103,37 @@ def main():
             attendee = attendees[user_id]
             event_attendee = EventAttendee.model_validate(ea_dict)
 
-            try:
-                # Initialize badge renderer
-                badge_renderer = BadgeRendererHTML(
-                    template_dir=ROOT / "config" / "html_templates" / "professional",
-                    event_id=event_id,
-                    event_name=event.display_name,
-                    event_date=event.date,
-                    sponsor=event.sponsor,
-                    event_logo_path=event.logo_path,
-                    sponsor_logo_path=event.sponsor_logo_path,
-                    tags=event.tags
-                )
-
-                # Generate badge PDF first
-                badge_output_dir = ROOT / "output" / "badges" / event_id
-                badge_output_dir.mkdir(parents=True, exist_ok=True)
-                badge_pdf_path = badge_output_dir / f"{user_id}_badge.pdf"
-
-                badge_renderer.render_badge(
-                    attendee=attendee,
-                    output_path=badge_pdf_path,
-                    tags=event_attendee.tags
-                )
-
-                # Initialize sample sheet renderer
-                sample_sheet_renderer = SampleSheetRenderer()
-
-                # Generate sample sheet PDF - flat naming scheme
-                output_filename = f"{event_id}_{user_id}_sample.pdf"
-                output_path = output_dir / output_filename
-
-                sample_sheet_renderer.render(
-                    event=event,
-                    attendee=attendee,
-                    event_attendee=event_attendee,
-                    badge_pdf_path=badge_pdf_path,
-                    output_path=output_path
-                )
-
-                print(f"✓ {event_id}/{user_id} - {attendee.name}")
-                generated += 1
-                generated_paths.append(output_path)
-
-            except Exception as e:
-                print(f"✗ ERROR: {event_id}/{user_id} - {e}")
-                import traceback
-                traceback.print_exc()
+            # Generate badge PDF first
+            badge_pdf_path = badge_output_dir / f"{user_id}_badge.pdf"
+
+            # Sample sheet PDF - flat naming scheme
+            output_path = output_dir / f"{event_id}_{user_id}_sample.pdf"
+
+            badge_jobs.append((attendee, event_attendee.tags, badge_pdf_path))
+            pending.append((event, attendee, event_attendee, badge_pdf_path, output_path))
+
+        if not badge_jobs:
+            continue
+
+        results = BadgeRendererHTML.render_many(init_kwargs, badge_jobs)
+        for sheet_job, (_, error) in zip(pending, results):
+            if error is None:
+                sheet_jobs.append(sheet_job)
+            else:
+                print(f"✗ ERROR: {event_id}/{sheet_job[1].id} - {error}")
                 errors += 1
 
+    # Generate sample sheet PDFs from the badge PDFs in one batch
+    results = SampleSheetRenderer().render_many(sheet_jobs)
+    for (event, attendee, _, _, _), (output_path, error) in zip(sheet_jobs, results):
+        if error is None:
+            print(f"✓ {event.event_id}/{attendee.id} - {attendee.name}")
+            generated += 1
+            generated_paths.append(output_path)
+        else:
+            print(f"✗ ERROR: {event.event_id}/{attendee.id} - {error}")
+            errors += 1
+
     print()
     print("=" * 70)
     print(f"Generated {generated} individual sample sheets")
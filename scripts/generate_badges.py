@@ -97,6 +97,27 @@ def main():
 
         event = events[event_id]
 
+        # Load template if not cached
+        if event.template_id not in templates:
+            templates[event.template_id] = load_template(event.template_id)
+
+        # Renderer arguments for this event; each worker process builds its own renderer
+        init_kwargs = dict(
+            template=templates[event.template_id],
+            event_name=event.display_name,
+            event_date=event.date or "",
+            sponsor=event.sponsor or "",
+            event_logo_path=event.logo_path,
+            sponsor_logo_path=event.sponsor_logo_path,
+            tag_categories=event.tag_categories
+        )
+
+        # Create event-specific output directory
+        event_badges_dir = BADGES_DIR / event.event_id
+        event_badges_dir.mkdir(parents=True, exist_ok=True)
+
+        jobs = []
+        names = []
         for event_attendee in event_attendees:
             attendee_id = event_attendee.user_id
             if attendee_id not in attendees_by_id:
@@ -113,36 +134,22 @@ def main():
             if interests_img_path.exists():
                 attendee_copy.interests_image_path = str(interests_img_path)
 
-            # Load template if not cached
-            if event.template_id not in templates:
-                templates[event.template_id] = load_template(event.template_id)
-
-            template = templates[event.template_id]
-
-            # Create renderer with tag_categories from event
-            renderer = BadgeRendererJSON(
-                template=template,
-                event_name=event.display_name,
-                event_date=event.date or "",
-                sponsor=event.sponsor or "",
-                event_logo_path=event.logo_path,
-                sponsor_logo_path=event.sponsor_logo_path,
-                tag_categories=event.tag_categories
-            )
-
-            # Create event-specific output directory
-            event_badges_dir = BADGES_DIR / event.event_id
-            event_badges_dir.mkdir(parents=True, exist_ok=True)
-
             # Generate badge with user_id filename, passing event-specific tags
             output_path = event_badges_dir / f"{attendee.id}.pdf"
-            try:
-                renderer.render_badge(attendee_copy, output_path, tags=event_attendee.tags)
-                print(f"   ✔ {attendee.name} → {output_path.relative_to(BADGES_DIR)}")
+            jobs.append((attendee_copy, event_attendee.tags, output_path))
+            names.append(attendee.name)
+
+        if not jobs:
+            continue
+
+        results = BadgeRendererJSON.render_all(init_kwargs, jobs)
+        for name, (output_path, error) in zip(names, results):
+            if error is None:
+                print(f"   ✔ {name} → {output_path.relative_to(BADGES_DIR)}")
                 generated += 1
                 generated_files.append(output_path)
-            except Exception as e:
-                print(f"   ✖ {attendee.name}: {e}")
+            else:
+                print(f"   ✖ {name}: {error}")
 
     # Summary
     print("\n" + "=" * 60)
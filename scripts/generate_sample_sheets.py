@@ -83,6 +83,9 @@ def main():
     skipped = 0
     errors = 0
 
+    # (event, attendee, event_attendee, badge_pdf_path, output_path) per rendered badge
+    sheet_jobs = []
+
     # Iterate through event-attendee combinations
     for event_id, ea_list in sorted(event_attendees.items()):
         # Apply event filter
@@ -96,6 +99,25 @@ def main():
 
         event = events[event_id]
 
+        # Badge renderer arguments for this event; each worker process builds its own renderer
+        init_kwargs = dict(
+            template_dir=ROOT / "config" / "html_templates" / "professional",
+            event_id=event_id,
+            event_name=event.display_name,
+            event_date=event.date,
+            sponsor=event.sponsor,
+            event_logo_path=event.logo_path,
+            sponsor_logo_path=event.sponsor_logo_path,
+            tags=event.tags
+        )
+
+        badge_output_dir = ROOT / "output" / "badges" / event_id
+        badge_output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = output_base / event_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        badge_jobs = []
+        pending = []
         for ea_dict in ea_list:
             user_id = ea_dict["user_id"]
 
@@ -111,55 +133,32 @@ def main():
             attendee = attendees[user_id]
             event_attendee = EventAttendee.model_validate(ea_dict)
 
-            try:
-                # Initialize badge renderer
-                badge_renderer = BadgeRendererHTML(
-                    template_dir=ROOT / "config" / "html_templates" / "professional",
-                    event_id=event_id,
-                    event_name=event.display_name,
-                    event_date=event.date,
-                    sponsor=event.sponsor,
-                    event_logo_path=event.logo_path,
-                    sponsor_logo_path=event.sponsor_logo_path,
-                    tags=event.tags
-                )
-
-                # Generate badge PDF first
-                badge_output_dir = ROOT / "output" / "badges" / event_id
-                badge_output_dir.mkdir(parents=True, exist_ok=True)
-                badge_pdf_path = badge_output_dir / f"{user_id}_badge.pdf"
-
-                badge_renderer.render_badge(
-                    attendee=attendee,
-                    output_path=badge_pdf_path,
-                    tags=event_attendee.tags
-                )
-
-                # Initialize sample sheet renderer
-                sample_sheet_renderer = SampleSheetRenderer()
-
-                # Generate sample sheet PDF using the badge PDF
-                output_dir = output_base / event_id
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_path = output_dir / f"{user_id}_sample.pdf"
-
-                sample_sheet_renderer.render(
-                    event=event,
-                    attendee=attendee,
-                    event_attendee=event_attendee,
-                    badge_pdf_path=badge_pdf_path,
-                    output_path=output_path
-                )
-
-                print(f"✓ {event_id}/{user_id} - {attendee.name}")
-                generated += 1
-
-            except Exception as e:
-                print(f"✗ ERROR: {event_id}/{user_id} - {e}")
-                import traceback
-                traceback.print_exc()
+            # Generate badge PDF first
+            badge_pdf_path = badge_output_dir / f"{user_id}_badge.pdf"
+            badge_jobs.append((attendee, event_attendee.tags, badge_pdf_path))
+            pending.append((event, attendee, event_attendee, badge_pdf_path, output_dir / f"{user_id}_sample.pdf"))
+
+        if not badge_jobs:
+            continue
+
+        results = BadgeRendererHTML.render_many(init_kwargs, badge_jobs)
+        for sheet_job, (_, error) in zip(pending, results):
+            if error is None:
+                sheet_jobs.append(sheet_job)
+            else:
+                print(f"✗ ERROR: {event_id}/{sheet_job[1].id} - {error}")
                 errors += 1
 
+    # Generate sample sheet PDFs from the badge PDFs in one batch
+    results = SampleSheetRenderer().render_many(sheet_jobs)
+    for (event, attendee, _, _, _), (_, error) in zip(sheet_jobs, results):
+        if error is None:
+            print(f"✓ {event.event_id}/{attendee.id} - {attendee.name}")
+            generated += 1
+        else:
+            print(f"✗ ERROR: {event.event_id}/{attendee.id} - {error}")
+            errors += 1
+
     print()
     print("=" * 70)
     print("Summary:")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Convert the Natural Earth shapefiles to GeoParquet.
+
+BoundaryFetcher loads `<layer>.parquet` next to each shapefile when present,
+which skips the OGR shapefile parse on every cold start. Requires pyarrow.
+
+Usage:
+    python scripts/prepare_boundaries.py
+"""
+from pathlib import Path
+import sys
+
+import geopandas as gpd
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.paths import get_data_dir
+
+LAYERS = [
+    Path("countries") / "ne_110m_admin_0_countries.shp",
+    Path("states") / "ne_110m_admin_1_states_provinces.shp",
+]
+
+
+def main():
+    """Write a zstd-compressed GeoParquet copy of each Natural Earth layer."""
+    data_dir = get_data_dir() / "natural_earth"
+
+    for layer in LAYERS:
+        shp_path = data_dir / layer
+        parquet_path = shp_path.with_suffix(".parquet")
+
+        gdf = gpd.read_file(shp_path)
+        gdf.to_parquet(parquet_path, compression="zstd")
+
+        print(f"✓ {shp_path.name} → {parquet_path.name} ({len(gdf)} features)")
+
+    print(f"\n✅ Boundaries ready in {data_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -55,31 +55,31 @@ def build_payload(attendee: dict, event_id: str, tags: dict, override_email: str
     Build the payload in the format expected by the Azure Function
     (matching Google Form webhook format)
     """
+    g = attendee.get
+
     # Parse interests into comma-separated string if it's a list
-    interests = attendee.get('interests', [])
+    interests = g('interests', [])
     if isinstance(interests, list):
         interests_str = ', '.join(interests)
     else:
-        interests_str = interests or attendee.get('raw_interests', '')
+        interests_str = interests or g('raw_interests', '')
 
-    payload = {
+    return {
         "event_id": event_id,
-        "name": attendee.get('name', ''),
-        "email": override_email or attendee.get('email', 'test@example.com'),
-        "title": attendee.get('title', ''),
-        "company": attendee.get('company', ''),
-        "location": attendee.get('location', ''),
+        "name": g('name', ''),
+        "email": override_email or g('email', 'test@example.com'),
+        "title": g('title', ''),
+        "company": g('company', ''),
+        "location": g('location', ''),
         "interests": interests_str,
-        "profile_url": attendee.get('profile_url', ''),
-        "preferred_social_platform": attendee.get('preferred_social_platform', ''),
-        "social_handle": attendee.get('social_handle', ''),
-        "pronouns": attendee.get('pronouns', ''),
+        "profile_url": g('profile_url', ''),
+        "preferred_social_platform": g('preferred_social_platform', ''),
+        "social_handle": g('social_handle', ''),
+        "pronouns": g('pronouns', ''),
         "tags": tags,
         "force_regenerate": force_regenerate
     }
 
-    return payload
-
 
 def send_to_function(payload: dict) -> dict:
     """Send payload to local Azure Function"""
@@ -8,16 +8,59 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
+import math
+import os
+import threading
 import time
 import re
 
+import numpy as np
 import requests
 import geopandas as gpd
+import shapely
 from shapely.geometry import Point
 from shapely.geometry.base import BaseGeometry
 
-
-@dataclass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Common US state abbreviations and names, plus lower-cased copies so
+# membership checks are case-insensitive without lowering the whole set
+_US_STATE_NAMES = (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC',
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California',
+    'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia',
+    'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas',
+    'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts',
+    'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana',
+    'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico',
+    'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma',
+    'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
+    'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont',
+    'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming',
+    'District of Columbia',
+)
+US_STATES = frozenset(_US_STATE_NAMES) | frozenset(s.lower() for s in _US_STATE_NAMES)
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedLocation:
     """Structured representation of a parsed location string."""
     original: str
@@ -26,7 +69,7 @@ class ParsedLocation:
     country: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeocodedLocation:
     """Geographic coordinates for a location."""
     latitude: float
@@ -37,70 +80,58 @@ class GeocodedLocation:
 class LocationParser:
     """Parses location strings into structured components."""
 
-    # Common US state abbreviations and names
-    US_STATES = {
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC',
-        'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California',
-        'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia',
-        'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas',
-        'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts',
-        'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana',
-        'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico',
-        'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma',
-        'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
-        'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont',
-        'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming',
-        'District of Columbia'
-    }
-
-    def parse(self, location_str: str) -> ParsedLocation:
+    US_STATES = US_STATES
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse(location_str: str) -> ParsedLocation:
         """
         Parse a location string into components.
 
+        Memoized: badge batches repeat the same locations, and the returned
+        ParsedLocation is frozen so sharing instances is safe.
+
         Examples:
             "Dayton, Ohio" -> ParsedLocation(city="Dayton", region="Ohio", country="USA")
             "Paris, France" -> ParsedLocation(city="Paris", country="France")
             "Toronto, ON, Canada" -> ParsedLocation(city="Toronto", region="ON", country="Canada")
         """
-        parts = [p.strip() for p in location_str.split(',')]
+        # partition() instead of split(): the common one- and two-part
+        # inputs never allocate a list
+        head, sep, tail = location_str.partition(',')
+        city = head.strip()
 
-        if len(parts) == 1:
+        if not sep:
             # Just city name
-            return ParsedLocation(original=location_str, city=parts[0])
+            return ParsedLocation(original=location_str, city=city)
+
+        second, sep, rest = tail.partition(',')
+        second = second.strip()
 
-        elif len(parts) == 2:
+        if not sep:
             # City, State/Country
-            city, second = parts
             # Check if second part is a US state
-            if second in self.US_STATES:
+            if second in US_STATES or second.lower() in US_STATES:
                 return ParsedLocation(
                     original=location_str,
                     city=city,
                     region=second,
                     country="United States"
                 )
-            else:
-                return ParsedLocation(
-                    original=location_str,
-                    city=city,
-                    country=second
-                )
-
-        elif len(parts) >= 3:
-            # City, State/Province, Country
-            city, region, country = parts[0], parts[1], parts[2]
             return ParsedLocation(
                 original=location_str,
                 city=city,
-                region=region,
-                country=country
+                country=second
             )
 
-        return ParsedLocation(original=location_str, city=location_str)
+        # City, State/Province, Country (anything after a third comma is ignored)
+        country = rest.partition(',')[0].strip()
+        return ParsedLocation(
+            original=location_str,
+            city=city,
+            region=second,
+            country=country
+        )
 
 
 class Geocoder:
@@ -109,28 +140,91 @@ class Geocoder:
     BASE_URL = "https://nominatim.openstreetmap.org/search"
     USER_AGENT = "NameTagGenerator/1.0"
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 min_request_interval: float = 1.0, concurrency: int = 1):
         """
         Initialize geocoder.
 
         Args:
             cache_dir: Optional directory to cache geocoding results
+            min_request_interval: Minimum seconds between requests. Public
+                Nominatim requires 1 req/sec max; use 0 for a self-hosted instance.
+            concurrency: Maximum in-flight requests for geocode_many()
         """
-        self.cache_dir = cache_dir
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_file = self.cache_dir / "geocode_cache.json" if self.cache_dir else None
+        self.cache = self._load_cache()
         self.last_request_time = 0
-        self.min_request_interval = 1.0  # Nominatim requires 1 req/sec max
+        self.min_request_interval = min_request_interval
+        self.concurrency = max(1, concurrency)
+        self._rate_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+
+        # Keep-alive session so successive lookups reuse the TCP/TLS connection
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = self.USER_AGENT
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> Geocoder:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _load_cache(self) -> dict[str, Optional[dict]]:
+        """Load geocoding cache from disk."""
+        if self.cache_file and self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  Warning: Discarding unreadable geocode cache {self.cache_file}: {e}")
+                return {}
+        return {}
+
+    def _save_cache(self) -> None:
+        """
+        Write new geocoding results to disk.
 
-    def _rate_limit(self):
-        """Ensure we don't exceed Nominatim's rate limit."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        Skipped when nothing changed since the last save. The file is written
+        to a temporary sibling and swapped in with os.replace, so an interrupted
+        run (or a concurrent process) never leaves a truncated cache behind.
+        """
+        if not self.cache_file or not self._cache_dirty:
+            return
+        with self._cache_lock:
+            snapshot = dict(self.cache)  # geocode_many threads may add entries
+            self._cache_dirty = False
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Normalize a query for cache lookup (case and whitespace insensitive)."""
+        return re.sub(r'\s+', ' ', query.strip().lower())
 
-    def geocode(self, location: ParsedLocation) -> Optional[GeocodedLocation]:
+    def _rate_limit(self):
+        """Ensure we don't exceed Nominatim's rate limit (shared across threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.min_request_interval:
+                time.sleep(self.min_request_interval - elapsed)
+            self.last_request_time = time.time()
+
+    def geocode(self, location: ParsedLocation, save: bool = True) -> Optional[GeocodedLocation]:
         """
         Geocode a parsed location to coordinates.
 
+        A new result is written to the disk cache right away unless save is
+        False (geocode_many saves once for the whole batch instead).
+
         Returns None if geocoding fails.
         """
         # Build search query
@@ -141,6 +235,14 @@ class Geocoder:
             query_parts.append(location.country)
         query = ", ".join(query_parts)
 
+        # Check cache first (no rate limiting needed on a hit)
+        cache_key = self._cache_key(query)
+        if cache_key in self.cache:
+            cached = self.cache[cache_key]
+            if cached is None:
+                return None
+            return GeocodedLocation(**cached)
+
         # Rate limit
         self._rate_limit()
 
@@ -152,31 +254,79 @@ class Geocoder:
                 'limit': 1,
                 'addressdetails': 1
             }
-            headers = {'User-Agent': self.USER_AGENT}
-
-            response = requests.get(
+            response = self._session.get(
                 self.BASE_URL,
                 params=params,
-                headers=headers,
                 timeout=10
             )
             response.raise_for_status()
 
-            results = response.json()
+            results = _json_loads(response.content)
             if not results:
+                # Cache misses too, so unknown locations aren't re-queried every run
+                self.cache[cache_key] = None
+                self._cache_dirty = True
+                if save:
+                    self._save_cache()
                 return None
 
             result = results[0]
-            return GeocodedLocation(
+            geocoded = GeocodedLocation(
                 latitude=float(result['lat']),
                 longitude=float(result['lon']),
                 display_name=result['display_name']
             )
+            self.cache[cache_key] = {
+                'latitude': geocoded.latitude,
+                'longitude': geocoded.longitude,
+                'display_name': geocoded.display_name
+            }
+            self._cache_dirty = True
+            if save:
+                self._save_cache()
+            return geocoded
 
         except (requests.RequestException, KeyError, ValueError) as e:
             print(f"Geocoding failed for '{query}': {e}")
             return None
 
+    def geocode_many(self, locations: list[ParsedLocation]) -> list[Optional[GeocodedLocation]]:
+        """
+        Geocode a batch of parsed locations.
+
+        Requests run on up to `concurrency` threads but all pass through the
+        shared rate limiter, so against public Nominatim they are still spaced
+        `min_request_interval` apart. Cache hits return without waiting.
+
+        New results are written to the disk cache once, after the batch.
+
+        Returns results in the same order as `locations`.
+        """
+        try:
+            if self.concurrency == 1 or len(locations) <= 1:
+                return [self.geocode(location, save=False) for location in locations]
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                return list(executor.map(lambda location: self.geocode(location, save=False), locations))
+        finally:
+            self._save_cache()
+
+
+@lru_cache(maxsize=None)
+def get_geocoder(cache_dir: Optional[Path] = None) -> Geocoder:
+    """
+    Get the shared Geocoder for a cache directory.
+
+    Reusing one instance keeps a single rate-limit clock for every render in
+    the process and loads the on-disk cache only once.
+    """
+    return Geocoder(cache_dir=cache_dir)
+
+
+# Spellings of the United States accepted in place of the Natural Earth admin name
+US_COUNTRY_ALIASES = frozenset({'usa', 'us', 'united states', 'united states of america'})
+NE_US_ADMIN = 'united states of america'
+
 
 class BoundaryFetcher:
     """Fetches state/country boundary geometries from Natural Earth data."""
@@ -187,6 +337,7 @@ class BoundaryFetcher:
 
         Args:
             data_dir: Path to directory containing Natural Earth shapefiles
+                (and optionally GeoParquet copies from scripts/prepare_boundaries.py)
         """
         self.data_dir = Path(data_dir)
         self.countries_path = self.data_dir / "countries" / "ne_110m_admin_0_countries.shp"
@@ -196,21 +347,121 @@ class BoundaryFetcher:
         self._countries_gdf: Optional[gpd.GeoDataFrame] = None
         self._states_gdf: Optional[gpd.GeoDataFrame] = None
 
+        # Exact-match lookup tables, built on first use
+        self._state_index: Optional[dict[tuple[str, str], list[BaseGeometry]]] = None
+        self._country_index: Optional[dict[str, list[BaseGeometry]]] = None
+
+    @staticmethod
+    def _load(shp_path: Path, lower_columns: Tuple[str, ...]) -> gpd.GeoDataFrame:
+        """
+        Load a Natural Earth layer, preferring the pre-converted GeoParquet copy.
+
+        Only the name columns and geometry are kept (Natural Earth ships
+        ~80-90 attribute columns we never read). Adds a `<column>_lower` copy
+        of each name column so lookups don't re-lowercase every row on every query.
+        """
+        parquet_path = shp_path.with_suffix(".parquet")
+        gdf = None
+        if parquet_path.exists():
+            try:
+                gdf = gpd.read_parquet(parquet_path)
+            except ImportError:
+                pass  # pyarrow not installed - fall back to the shapefile
+        if gdf is None:
+            gdf = gpd.read_file(shp_path)
+
+        keep = [column for column in lower_columns if column in gdf.columns]
+        keep.append(gdf.geometry.name)
+        gdf = gdf[keep].copy()
+
+        for column in lower_columns:
+            if column in gdf.columns:
+                gdf[f"{column}_lower"] = gdf[column].str.lower()
+        return gdf
+
     @property
     def countries_gdf(self) -> gpd.GeoDataFrame:
         """Lazy load countries GeoDataFrame."""
         if self._countries_gdf is None:
-            self._countries_gdf = gpd.read_file(self.countries_path)
+            self._countries_gdf = self._load(self.countries_path, ('NAME', 'NAME_LONG'))
         return self._countries_gdf
 
     @property
     def states_gdf(self) -> gpd.GeoDataFrame:
         """Lazy load states GeoDataFrame."""
         if self._states_gdf is None:
-            self._states_gdf = gpd.read_file(self.states_path)
+            self._states_gdf = self._load(self.states_path, ('admin', 'name', 'postal'))
         return self._states_gdf
 
-    def get_boundary(self, location: ParsedLocation) -> Optional[BaseGeometry]:
+    def preload(self) -> None:
+        """Load both layers and build the name and spatial indexes ahead of the first lookup."""
+        _ = self.state_index
+        _ = self.country_index
+        _ = self.states_gdf.sindex
+        _ = self.countries_gdf.sindex
+
+    @staticmethod
+    def _add_candidate(index: dict, key, geom: BaseGeometry) -> None:
+        """Append geom under key, keeping row order and skipping repeats of the same row."""
+        bucket = index.setdefault(key, [])
+        if not bucket or bucket[-1] is not geom:
+            bucket.append(geom)
+
+    @staticmethod
+    def _select_candidate(candidates: list[BaseGeometry],
+                          point: Optional[Tuple[float, float]]) -> BaseGeometry:
+        """
+        Pick the candidate containing point, else the first candidate.
+
+        Ambiguous names (same name in several rows) are resolved with one
+        vectorized GEOS containment test over all candidates.
+        """
+        if point is None or len(candidates) == 1:
+            return candidates[0]
+        lon, lat = point
+        hits = shapely.contains_xy(candidates, lon, lat)
+        # No hit happens when the point sits just outside the simplified 110m outline
+        return next((geom for geom, hit in zip(candidates, hits) if hit), candidates[0])
+
+    @property
+    def state_index(self) -> dict[tuple[str, str], list[BaseGeometry]]:
+        """(admin, name or postal code), lower-cased -> candidate state geometries."""
+        if self._state_index is None:
+            gdf = self.states_gdf
+            index: dict[tuple[str, str], list[BaseGeometry]] = {}
+            postals = gdf['postal_lower'] if 'postal_lower' in gdf.columns else [None] * len(gdf)
+            for admin, name, postal, geom in zip(gdf['admin_lower'], gdf['name_lower'],
+                                                 postals, gdf.geometry):
+                if not isinstance(admin, str):
+                    continue
+                if isinstance(name, str):
+                    self._add_candidate(index, (admin, name), geom)
+                if isinstance(postal, str):
+                    self._add_candidate(index, (admin, postal), geom)
+            self._state_index = index
+        return self._state_index
+
+    @property
+    def country_index(self) -> dict[str, list[BaseGeometry]]:
+        """Lower-cased country name / long name -> candidate country geometries."""
+        if self._country_index is None:
+            gdf = self.countries_gdf
+            index: dict[str, list[BaseGeometry]] = {}
+            long_names = gdf['NAME_LONG_lower'] if 'NAME_LONG_lower' in gdf.columns else [None] * len(gdf)
+            for name, long_name, geom in zip(gdf['NAME_lower'], long_names, gdf.geometry):
+                if isinstance(name, str):
+                    self._add_candidate(index, name, geom)
+                if isinstance(long_name, str):
+                    self._add_candidate(index, long_name, geom)
+            us_geoms = index.get(NE_US_ADMIN)
+            if us_geoms:
+                for alias in US_COUNTRY_ALIASES:
+                    index.setdefault(alias, us_geoms)
+            self._country_index = index
+        return self._country_index
+
+    def get_boundary(self, location: ParsedLocation,
+                     point: Optional[Tuple[float, float]] = None) -> Optional[BaseGeometry]:
         """
         Get the boundary geometry for a location.
 
@@ -218,66 +469,129 @@ class BoundaryFetcher:
         1. State/province if available
         2. Country if available
         3. None if not found
+
+        Args:
+            location: Parsed location
+            point: Optional geocoded (lon, lat) used to choose between rows
+                that share a name
         """
         # Try state/province first
         if location.region:
             state_geom = self._get_state_boundary(
                 location.region,
-                location.country or "United States"
+                location.country or "United States",
+                point
             )
+            if state_geom is None and point is not None:
+                # Region name didn't match (misspelling, alternate name) - use the point
+                state_geom = self._get_boundary_containing(self.states_gdf, point)
             if state_geom is not None:
                 return state_geom
 
         # Fall back to country
         if location.country:
-            return self._get_country_boundary(location.country)
+            country_geom = self._get_country_boundary(location.country, point)
+            if country_geom is not None:
+                return country_geom
+
+        # Last resort (e.g. city-only input): whatever contains the geocoded point
+        if point is not None:
+            return self.get_boundary_by_point(*point)
 
         return None
 
-    def _get_state_boundary(self, region: str, country: str) -> Optional[BaseGeometry]:
-        """Get state/province boundary geometry."""
-        gdf = self.states_gdf
+    def get_boundary_by_point(self, lon: float, lat: float) -> Optional[BaseGeometry]:
+        """
+        Get the most specific boundary containing a geocoded point.
+
+        Returns the enclosing state/province if any, else the enclosing
+        country, else None.
+        """
+        point = (lon, lat)
+        state_geom = self._get_boundary_containing(self.states_gdf, point)
+        if state_geom is not None:
+            return state_geom
+        return self._get_boundary_containing(self.countries_gdf, point)
+
+    @staticmethod
+    def _get_boundary_containing(gdf: gpd.GeoDataFrame,
+                                 point: Tuple[float, float]) -> Optional[BaseGeometry]:
+        """First geometry (in row order) containing point, via the GeoDataFrame's STRtree."""
+        # sindex is built lazily by geopandas on first access and cached on the frame
+        hits = gdf.sindex.query(Point(point), predicate='within')
+        if len(hits) == 0:
+            return None
+        return gdf.geometry.iloc[int(hits.min())]
 
-        # Normalize country name for matching
+    def _get_state_boundary(self, region: str, country: str,
+                            point: Optional[Tuple[float, float]] = None) -> Optional[BaseGeometry]:
+        """Get state/province boundary geometry."""
         country_normalized = country.lower()
-        if country_normalized in ['usa', 'us', 'united states', 'united states of america']:
-            country_match = gdf['admin'].str.lower().str.contains('united states', na=False)
+        region_lower = region.lower()
+
+        # Fast path: exact (country, name/postal) hit
+        index_country = NE_US_ADMIN if country_normalized in US_COUNTRY_ALIASES else country_normalized
+        candidates = self.state_index.get((index_country, region_lower))
+        if candidates:
+            return self._select_candidate(candidates, point)
+
+        # Slow path: substring match on the country name
+        gdf = self.states_gdf
+        if country_normalized in US_COUNTRY_ALIASES:
+            country_match = gdf['admin_lower'].str.contains('united states', na=False)
         else:
-            country_match = gdf['admin'].str.lower().str.contains(country_normalized, na=False)
+            country_match = gdf['admin_lower'].str.contains(country_normalized, na=False)
 
         # Try exact name match
-        region_lower = region.lower()
-        name_match = gdf['name'].str.lower() == region_lower
+        name_match = gdf['name_lower'] == region_lower
 
         # Try postal code match (for US states like "OH")
-        postal_match = gdf['postal'].str.lower() == region_lower if 'postal' in gdf.columns else False
+        postal_match = gdf['postal_lower'] == region_lower if 'postal_lower' in gdf.columns else False
 
         matches = gdf[country_match & (name_match | postal_match)]
 
         if len(matches) > 0:
-            return matches.iloc[0].geometry
+            return self._select_candidate(list(matches.geometry), point)
 
         return None
 
-    def _get_country_boundary(self, country: str) -> Optional[BaseGeometry]:
+    def _get_country_boundary(self, country: str,
+                              point: Optional[Tuple[float, float]] = None) -> Optional[BaseGeometry]:
         """Get country boundary geometry."""
-        gdf = self.countries_gdf
         country_lower = country.lower()
 
+        # Fast path: exact name, long name, or alias hit
+        candidates = self.country_index.get(country_lower)
+        if candidates:
+            return self._select_candidate(candidates, point)
+
+        # Slow path: substring match on the long name
+        gdf = self.countries_gdf
+
         # Try exact name match
-        name_match = gdf['NAME'].str.lower() == country_lower
+        name_match = gdf['NAME_lower'] == country_lower
 
         # Try common name match
-        common_match = gdf['NAME_LONG'].str.lower().str.contains(country_lower, na=False) if 'NAME_LONG' in gdf.columns else False
+        common_match = gdf['NAME_LONG_lower'].str.contains(country_lower, na=False) if 'NAME_LONG_lower' in gdf.columns else False
 
         matches = gdf[name_match | common_match]
 
         if len(matches) > 0:
-            return matches.iloc[0].geometry
+            return self._select_candidate(list(matches.geometry), point)
 
         return None
 
 
+@lru_cache(maxsize=None)
+def get_boundary_fetcher(data_dir: Path) -> BoundaryFetcher:
+    """
+    Get the shared BoundaryFetcher for a data directory.
+
+    Natural Earth layers are loaded once per process instead of once per badge.
+    """
+    return BoundaryFetcher(data_dir)
+
+
 class CoordinateTransformer:
     """Transforms geographic coordinates to pixel coordinates within a bounding box."""
 
@@ -306,13 +620,20 @@ class CoordinateTransformer:
         scale_y = self.canvas_height * (1 - 2 * padding_ratio) / geo_height
 
         # Use minimum scale to fit entire boundary
-        self.scale = min(scale_x, scale_y)
+        self.scale = float(min(scale_x, scale_y))
 
         # Calculate offsets to center the boundary
         scaled_width = geo_width * self.scale
         scaled_height = geo_height * self.scale
-        self.offset_x = (self.canvas_width - scaled_width) / 2
-        self.offset_y = (self.canvas_height - scaled_height) / 2
+        self.offset_x = float((self.canvas_width - scaled_width) / 2)
+        self.offset_y = float((self.canvas_height - scaled_height) / 2)
+
+        # Collapse normalize/scale/offset into one affine per axis:
+        # x = lon * ax + bx, y = lat * ay + by (ay is negative to flip Y)
+        self.ax = self.scale
+        self.bx = self.offset_x - minx * self.scale
+        self.ay = -self.scale
+        self.by = self.offset_y + maxy * self.scale
 
     def geo_to_pixel(self, lon: float, lat: float) -> Tuple[float, float]:
         """
@@ -325,30 +646,61 @@ class CoordinateTransformer:
         Returns:
             (x, y) pixel coordinates
         """
-        minx, miny, maxx, maxy = self.geo_bounds
+        return lon * self.ax + self.bx, lat * self.ay + self.by
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _affine_numba(coords, ax, bx, ay, by, out_x, out_y):
+        """Apply x = lon*ax + bx, y = lat*ay + by to an (N, 2) array without temporaries."""
+        for i in range(coords.shape[0]):
+            out_x[i] = coords[i, 0] * ax + bx
+            out_y[i] = coords[i, 1] * ay + by
+
 
-        # Normalize to 0-1 range within bounds
-        norm_x = (lon - minx) / (maxx - minx) if maxx != minx else 0.5
-        norm_y = (maxy - lat) / (maxy - miny) if maxy != miny else 0.5  # Flip Y axis
+# Unit-radius vertices of a 5-pointed star (outer radius 1.0, inner 0.4),
+# alternating outer/inner starting at the top, for _create_star_marker
+_STAR_UNIT_POINTS = tuple(
+    (radius * math.cos(angle), radius * math.sin(angle))
+    for i in range(5)
+    for angle, radius in (
+        (math.radians(i * 72 - 90), 1.0),
+        (math.radians(i * 72 - 90 + 36), 0.4),
+    )
+)
 
-        # Scale and offset
-        pixel_x = norm_x * (maxx - minx) * self.scale + self.offset_x
-        pixel_y = norm_y * (maxy - miny) * self.scale + self.offset_y
 
-        return pixel_x, pixel_y
+# SVG document skeleton: width, height, viewBox width/height, path, star marker
+_SVG_TEMPLATE = b'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     width="%b"
+     height="%b"
+     viewBox="0 0 %b %b">
+  %b
+  %b
+</svg>'''
 
 
 class SVGRenderer:
     """Renders boundary outlines and location markers as SVG."""
 
-    def __init__(self, canvas_size: Tuple[float, float]):
+    def __init__(self, canvas_size: Tuple[float, float], geo_coordinates: bool = False):
         """
         Initialize SVG renderer.
 
         Args:
             canvas_size: (width, height) in pixels
+            geo_coordinates: If True, emit the boundary path in raw lon/lat and
+                let the SVG consumer apply the geo->pixel affine via a
+                <g transform="matrix(...)">, instead of transforming every
+                vertex in Python. Output renders identically.
         """
         self.canvas_width, self.canvas_height = canvas_size
+        self.geo_coordinates = geo_coordinates
+
+        # Reusable output buffers for the Numba transform (grown on demand)
+        self._buf_x = np.empty(0)
+        self._buf_y = np.empty(0)
 
     def render(self, boundary: BaseGeometry, marker_pos: Tuple[float, float],
                output_path: Path) -> None:
@@ -360,100 +712,161 @@ class SVGRenderer:
             marker_pos: (x, y) pixel coordinates for star marker
             output_path: Path to save SVG file
         """
+        # Write to file
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(self.to_svg(boundary, marker_pos))
+
+    def to_svg(self, boundary: BaseGeometry, marker_pos: Tuple[float, float]) -> bytes:
+        """
+        Build the SVG document for a boundary outline with marker.
+
+        Args:
+            boundary: Shapely geometry for boundary
+            marker_pos: (x, y) pixel coordinates for star marker
+
+        Returns:
+            UTF-8 encoded SVG document
+        """
         # Initialize coordinate transformer
         transformer = CoordinateTransformer(boundary, (self.canvas_width, self.canvas_height))
 
+        # Drop detail finer than half a pixel before emitting the path
+        # (Douglas-Peucker in geo units; topology-preserving so rings stay valid)
+        tolerance = 0.5 / transformer.scale
+        simplified = boundary.simplify(tolerance, preserve_topology=True)
+
         # Convert boundary to SVG path
-        path_data = self._geometry_to_svg_path(boundary, transformer)
+        if self.geo_coordinates:
+            path_data = self._geometry_to_svg_path(simplified, transformer, geo_units=True)
+            t = transformer
+            # Stroke width is in geo units inside the transform (scale is uniform)
+            path_svg = (
+                f'<g transform="matrix({t.ax!r} 0 0 {t.ay!r} {t.bx!r} {t.by!r})">\n'
+                f'    <path d="{path_data}"\n'
+                f'          fill="none"\n'
+                f'          stroke="#3D405B"\n'
+                f'          stroke-width="{2 / t.scale!r}"\n'
+                f'          stroke-linejoin="round"/>\n'
+                f'  </g>'
+            )
+        else:
+            path_data = self._geometry_to_svg_path(simplified, transformer)
+            path_svg = (
+                f'<path d="{path_data}"\n'
+                f'        fill="none"\n'
+                f'        stroke="#3D405B"\n'
+                f'        stroke-width="2"\n'
+                f'        stroke-linejoin="round"/>'
+            )
 
         # Generate star marker
         star_svg = self._create_star_marker(marker_pos[0], marker_pos[1], size=8)
 
         # Build SVG document
-        svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{self.canvas_width}"
-     height="{self.canvas_height}"
-     viewBox="0 0 {self.canvas_width} {self.canvas_height}">
-  <path d="{path_data}"
-        fill="none"
-        stroke="#3D405B"
-        stroke-width="2"
-        stroke-linejoin="round"/>
-  {star_svg}
-</svg>'''
-
-        # Write to file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        width = str(self.canvas_width).encode('ascii')
+        height = str(self.canvas_height).encode('ascii')
+        return _SVG_TEMPLATE % (width, height, width, height,
+                                path_svg.encode('ascii'), star_svg.encode('ascii'))
 
     def _geometry_to_svg_path(self, geometry: BaseGeometry,
-                              transformer: CoordinateTransformer) -> str:
-        """Convert Shapely geometry to SVG path data."""
+                              transformer: CoordinateTransformer,
+                              geo_units: bool = False) -> str:
+        """Convert Shapely geometry to SVG path data (raw lon/lat if geo_units)."""
         from shapely.geometry import Polygon, MultiPolygon
 
         paths = []
 
         if isinstance(geometry, Polygon):
-            paths.append(self._polygon_to_path(geometry, transformer))
+            paths.append(self._polygon_to_path(geometry, transformer, geo_units))
         elif isinstance(geometry, MultiPolygon):
-            for polygon in geometry.geoms:
-                paths.append(self._polygon_to_path(polygon, transformer))
+            # Largest landmass first; skip islands that project to under a pixel
+            # (e.g. small outlying islands on a country-scale outline)
+            for polygon in sorted(geometry.geoms, key=lambda g: g.area, reverse=True):
+                minx, miny, maxx, maxy = polygon.bounds
+                if max(maxx - minx, maxy - miny) * transformer.scale < 1.0:
+                    continue
+                paths.append(self._polygon_to_path(polygon, transformer, geo_units))
 
         return " ".join(paths)
 
     def _polygon_to_path(self, polygon: 'Polygon',
-                        transformer: CoordinateTransformer) -> str:
-        """Convert a Shapely Polygon to SVG path data."""
-        coords = list(polygon.exterior.coords)
+                        transformer: CoordinateTransformer,
+                        geo_units: bool = False) -> str:
+        """Convert a Shapely Polygon to SVG path data (raw lon/lat if geo_units)."""
+        # (N, 2) float64 array straight from GEOS - no per-vertex tuples
+        coords = shapely.get_coordinates(polygon.exterior)
 
-        if not coords:
+        if coords.shape[0] == 0:
             return ""
 
-        # Start path
-        first_x, first_y = transformer.geo_to_pixel(coords[0][0], coords[0][1])
-        path_parts = [f"M {first_x:.2f},{first_y:.2f}"]
-
-        # Add line segments
-        for lon, lat in coords[1:]:
-            x, y = transformer.geo_to_pixel(lon, lat)
-            path_parts.append(f"L {x:.2f},{y:.2f}")
-
-        # Close path
-        path_parts.append("Z")
-
-        return " ".join(path_parts)
+        if geo_units:
+            # Geo units; 4 decimals keeps sub-pixel precision at badge scale
+            points = ["%.4f,%.4f" % xy for xy in map(tuple, coords.tolist())]
+        else:
+            # Transform all vertices at once using the transformer's affine
+            px, py = self._transform(coords, transformer)
+
+            points = ["%.2f,%.2f" % xy for xy in zip(px.tolist(), py.tolist())]
+
+        # Move to first vertex, line to the rest, close path
+        if len(points) == 1:
+            return "M " + points[0] + " Z"
+        return "M " + points[0] + " L " + " L ".join(points[1:]) + " Z"
+
+    def _transform(self, coords: np.ndarray,
+                   transformer: CoordinateTransformer) -> Tuple[np.ndarray, np.ndarray]:
+        """Map an (N, 2) lon/lat array to pixel x and y arrays."""
+        t = transformer
+        if not NUMBA_AVAILABLE:
+            return coords[:, 0] * t.ax + t.bx, coords[:, 1] * t.ay + t.by
+
+        n = coords.shape[0]
+        if self._buf_x.shape[0] < n:
+            self._buf_x = np.empty(n)
+            self._buf_y = np.empty(n)
+        _affine_numba(coords, t.ax, t.bx, t.ay, t.by, self._buf_x, self._buf_y)
+        return self._buf_x[:n], self._buf_y[:n]
 
     def _create_star_marker(self, cx: float, cy: float, size: float = 8) -> str:
         """Create a star marker SVG element."""
-        # 5-pointed star
-        points = []
-        for i in range(5):
-            # Outer point
-            angle_outer = (i * 72 - 90) * 3.14159 / 180
-            x_outer = cx + size * 1.0 * (angle_outer ** 0 - angle_outer ** 0 + 1) * \
-                      (1 if i == 0 else (-1 if i in [1, 4] else 0)) * \
-                      abs((0 if i == 0 else (0.951 if i == 1 else (-0.588 if i == 2 else (-0.588 if i == 3 else 0.951)))))
-            y_outer = cy + size * 1.0 * (angle_outer ** 0 - angle_outer ** 0 + 1) * \
-                      ((-1 if i == 0 else (0.309 if i in [1, 4] else 0.809)))
-
-            # Simpler approach: use actual trig
-            import math
-            angle_outer = (i * 72 - 90) * math.pi / 180
-            x_outer = cx + size * math.cos(angle_outer)
-            y_outer = cy + size * math.sin(angle_outer)
-            points.append(f"{x_outer:.2f},{y_outer:.2f}")
-
-            # Inner point
-            angle_inner = (i * 72 - 90 + 36) * math.pi / 180
-            x_inner = cx + size * 0.4 * math.cos(angle_inner)
-            y_inner = cy + size * 0.4 * math.sin(angle_inner)
-            points.append(f"{x_inner:.2f},{y_inner:.2f}")
+        # 5-pointed star: scale the precomputed unit vertices and translate
+        points = ["%.2f,%.2f" % (cx + size * dx, cy + size * dy) for dx, dy in _STAR_UNIT_POINTS]
 
         return f'<polygon points="{" ".join(points)}" fill="#E07A5F" stroke="none"/>'
 
 
+def preload_location_resources(locations: Optional[list[str]] = None, data_dir: Optional[Path] = None) -> None:
+    """
+    Build the shared Geocoder and BoundaryFetcher (with its indexes) on the calling thread.
+
+    Call before rendering graphics from several threads: the cached getters and
+    the fetcher's lazy indexes have no locks, so concurrent first use could build
+    duplicates - including a second Geocoder with its own rate-limit clock.
+    Locations passed in are geocoded as one batch (Geocoder.geocode_many), so
+    the later renders only hit the geocode cache.
+
+    Args:
+        locations: Location strings about to be rendered
+        data_dir: Natural Earth data directory (default: same as render_location_graphic)
+    """
+    from src.utils.paths import data_path, get_output_dir
+
+    if data_dir is None:
+        data_dir = data_path("natural_earth")
+
+    geocoder = get_geocoder(get_output_dir())
+    get_boundary_fetcher(Path(data_dir)).preload()
+
+    if locations:
+        parser = LocationParser()
+        geocoder.geocode_many([parser.parse(location) for location in locations])
+
+
+# Rendered SVG bytes keyed by (location_str, canvas_size, data_dir), so repeat
+# locations in a batch skip parse/geocode/boundary/render entirely
+_svg_cache: dict[tuple[str, Tuple[float, float], str], bytes] = {}
+
+
 def render_location_graphic(location_str: str, output_path: Path,
                            canvas_size: Tuple[float, float] = (144, 144),
                            data_dir: Optional[Path] = None) -> Optional[Path]:
@@ -471,26 +884,44 @@ def render_location_graphic(location_str: str, output_path: Path,
     Returns:
         Path to generated SVG file, or None if generation failed
     """
+    from src.utils.paths import data_path, get_output_dir
+
     # Default data directory (project root / data / natural_earth)
     if data_dir is None:
-        from src.utils.paths import get_data_dir
-        data_dir = get_data_dir() / "natural_earth"
+        data_dir = data_path("natural_earth")
+
+    cache_key = (location_str, tuple(canvas_size), str(data_dir))
+    cached_svg = _svg_cache.get(cache_key)
+    if cached_svg is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(cached_svg)
+        return output_path
 
     try:
         # Parse location
         parser = LocationParser()
         parsed_location = parser.parse(location_str)
 
-        # Geocode
-        geocoder = Geocoder()
-        geocoded = geocoder.geocode(parsed_location)
+        geocoder = get_geocoder(get_output_dir())
+        boundary_fetcher = get_boundary_fetcher(Path(data_dir))
+
+        # Geocode (network) while the boundary layers load (disk); the lookup
+        # itself needs the geocoded point, so only the loading overlaps
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            geocode_future = executor.submit(geocoder.geocode, parsed_location)
+            preload_future = executor.submit(boundary_fetcher.preload)
+            geocoded = geocode_future.result()
+            preload_future.result()
+
         if geocoded is None:
             print(f"Failed to geocode: {location_str}")
             return None
 
         # Get boundary
-        boundary_fetcher = BoundaryFetcher(data_dir)
-        boundary = boundary_fetcher.get_boundary(parsed_location)
+        boundary = boundary_fetcher.get_boundary(
+            parsed_location,
+            point=(geocoded.longitude, geocoded.latitude)
+        )
         if boundary is None:
             print(f"Failed to find boundary for: {location_str}")
             return None
@@ -504,7 +935,11 @@ def render_location_graphic(location_str: str, output_path: Path,
 
         # Render SVG
         renderer = SVGRenderer(canvas_size)
-        renderer.render(boundary, (marker_x, marker_y), output_path)
+        svg_bytes = renderer.to_svg(boundary, (marker_x, marker_y))
+        _svg_cache[cache_key] = svg_bytes
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(svg_bytes)
 
         return output_path
 
@@ -3,23 +3,393 @@ Badge renderer using HTML/CSS templates and WeasyPrint for PDF generation.
 This is a parallel implementation to badge_renderer_json.py for comparison.
 """
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from pathlib import Path
-from typing import Optional
-import io
-import base64
-from PIL import Image
-
-from jinja2 import Template
+from typing import Callable, Optional
+import atexit
+import json
+import multiprocessing.util
+import os
+import threading
+import numpy as np
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 import qrcode
-from reportlab.pdfbase import pdfmetrics
 
 from ..models import Attendee, TagCategory
 from ..utils.name_utils import get_display_name
-from ..location.location_renderer import render_location_graphic
+from ..utils.font_metrics import helvetica_text_width
+from ..location.location_renderer import preload_location_resources, render_location_graphic
 from ..location.location_normalizer import LocationNormalizer
 
 
+# Shared across every document so font discovery happens once per process
+_FONT_CONFIG = FontConfiguration()
+
+
+@lru_cache(maxsize=None)
+def _get_template_env(template_dir: str) -> Environment:
+    """
+    Get the shared Jinja environment for a template directory.
+
+    The environment caches compiled templates in memory, and the bytecode
+    cache persists them across processes (output dir is writable in Azure too).
+    """
+    from src.utils.paths import get_output_dir
+    bytecode_dir = get_output_dir() / "jinja_cache"
+    bytecode_dir.mkdir(exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir))
+    )
+
+
+@lru_cache(maxsize=16)
+def _load_css(css_path: str, mtime: float) -> CSS:
+    """Parse a stylesheet once per (path, mtime) and reuse the CSS object for every PDF."""
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return CSS(string=f.read(), font_config=_FONT_CONFIG)
+
+
+@lru_cache(maxsize=2048)
+def _qr_svg(url: str, border: int = 2) -> str:
+    """
+    Build a QR code for a URL as inline SVG markup (memoized per URL).
+
+    Modules come straight from the QR matrix, with each horizontal run of dark
+    modules merged into one rectangle subpath. There's no raster, PNG or base64
+    step, and WeasyPrint draws the vector path crisply at print resolution.
+    """
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        border=border
+    )
+    qr.add_data(url or "")
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+
+    parts = []
+    for y, row in enumerate(matrix):
+        x = 0
+        width = len(row)
+        while x < width:
+            if row[x]:
+                start = x
+                while x < width and row[x]:
+                    x += 1
+                run = x - start
+                parts.append(f"M{start} {y}h{run}v1h-{run}z")
+            else:
+                x += 1
+
+    size = len(matrix)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" class="qr-code" viewBox="0 0 {size} {size}" '
+        f'shape-rendering="crispEdges"><rect width="{size}" height="{size}" fill="#fff"/>'
+        f'<path fill="#000" d="{"".join(parts)}"/></svg>'
+    )
+
+
+# Layout constants behind _title_line_count and _tag_row_styling
+_TITLE_MAX_WIDTH = 2.2  # inches available for the title (right of the location graphic)
+_TITLE_WRAP_MARGIN = 0.05  # titles within 5% of the max width are assumed to wrap
+_TAG_ROW_SAFETY_FACTOR = 0.93  # AFM widths don't account for the semibold tag text
+_TAG_FONT_STEPS = (8, 7.5, 7)
+_TAG_PADDING_STEPS = (0.12, 0.10, 0.08)
+_TAG_GAP_STEPS = (0.08, 0.06, 0.04)
+
+# Cross-run cache for the layout calculations below. Results depend only on the
+# inputs, the Helvetica widths and the constants above; the version covers the
+# last two (bump the tag when the metrics change), so any change drops the file.
+_LAYOUT_CACHE_VERSION = json.dumps([
+    "helvetica-afm-2", _TITLE_MAX_WIDTH, _TITLE_WRAP_MARGIN, _TAG_ROW_SAFETY_FACTOR,
+    _TAG_FONT_STEPS, _TAG_PADDING_STEPS, _TAG_GAP_STEPS,
+])
+_layout_cache: Optional[dict] = None
+_layout_cache_dirty = False
+_layout_cache_lock = threading.Lock()
+
+
+def _layout_cache_file() -> Path:
+    from src.utils.paths import get_output_dir
+    return get_output_dir() / "layout_cache.json"
+
+
+def _load_layout_cache() -> dict:
+    """Load the layout cache from disk (once per process)."""
+    global _layout_cache
+    if _layout_cache is None:
+        _layout_cache = {}
+        cache_file = _layout_cache_file()
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == _LAYOUT_CACHE_VERSION:
+                    _layout_cache = data.get('entries', {})
+            except Exception:
+                pass
+        atexit.register(_save_layout_cache)
+    return _layout_cache
+
+
+def _save_layout_cache() -> None:
+    """
+    Write new layout cache entries to disk.
+
+    Merges with the entries currently on disk so parallel workers don't drop
+    each other's results, and replaces the file atomically so they can't
+    corrupt it. Runs at interpreter exit and, in render_many workers (forked
+    workers skip atexit handlers), from a multiprocessing finalizer.
+    """
+    global _layout_cache_dirty
+    if not _layout_cache_dirty:
+        return
+    cache_file = _layout_cache_file()
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        entries = {}
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == _LAYOUT_CACHE_VERSION:
+                    entries = data.get('entries', {})
+            except ValueError:
+                pass
+        with _layout_cache_lock:
+            entries.update(_layout_cache)
+            _layout_cache_dirty = False
+        with open(tmp_file, 'w') as f:
+            json.dump({'version': _LAYOUT_CACHE_VERSION, 'entries': entries}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _disk_cached(func: Callable) -> Callable:
+    """Back a pure layout function with the persistent layout cache (JSON-serializable args/results)."""
+    @wraps(func)
+    def wrapper(*args):
+        global _layout_cache_dirty
+        cache = _load_layout_cache()
+        key = json.dumps([func.__name__, args])
+        if key in cache:
+            result = cache[key]
+            return tuple(result) if isinstance(result, list) else result
+        result = func(*args)
+        with _layout_cache_lock:
+            cache[key] = result
+            _layout_cache_dirty = True
+        return result
+    return wrapper
+
+
+@lru_cache(maxsize=4096)
+@_disk_cached
+def _title_line_count(title: str, font_size: float) -> int:
+    """Measure a non-empty title and return 1 or 2 lines (memoized across badges)."""
+    # Measure rendered width (Helvetica)
+    width_pts = helvetica_text_width(title, font_size)
+    width_inches = width_pts / 72.0
+
+    # Conservative threshold (title constraints from styles.css)
+    safety_margin = _TITLE_WRAP_MARGIN * _TITLE_MAX_WIDTH
+
+    if width_inches <= (_TITLE_MAX_WIDTH - safety_margin):
+        return 1
+    else:
+        return 2  # CSS line-clamp limits to 2 max
+
+
+@lru_cache(maxsize=4096)
+@_disk_cached
+def _tag_row_styling(tag_values: tuple[str, ...], max_width: float) -> tuple[float, float, float]:
+    """
+    Auto-shrink search behind BadgeRendererHTML._calculate_tag_row_styling.
+
+    Memoized on the tag values since attendees of an event share a small set of tag rows.
+
+    Returns:
+        (font_size, padding_h, gap)
+    """
+    if not tag_values:
+        return _TAG_FONT_STEPS[0], _TAG_PADDING_STEPS[0], _TAG_GAP_STEPS[0]
+
+    # Default styling
+    base_font_size = 8
+    base_padding_h = 0.12
+    base_padding_v = 0.06
+    base_gap = 0.08
+    border_radius = 0.08
+    font_weight = 600  # Using semibold weight
+
+    # Safety margin: Helvetica AFM widths don't account for bold/semibold rendering
+    # which makes text slightly wider, so only part of max_width is used
+    safe_max_width = max_width * _TAG_ROW_SAFETY_FACTOR
+
+    # Progressive reduction steps
+    gap_steps = _TAG_GAP_STEPS
+    padding_steps = _TAG_PADDING_STEPS
+    font_steps = _TAG_FONT_STEPS
+
+    # Evaluate all 27 combinations at once: total[f, p, g] is the row width in inches.
+    # Text width scales linearly with font size, so measure each tag once at 1pt.
+    n_tags = len(tag_values)
+    text_width_1pt = sum(helvetica_text_width(tag_text, 1.0) for tag_text in tag_values)
+    text_widths = text_width_1pt * np.array(font_steps) / 72.0
+    total = (
+        text_widths[:, None, None]
+        + (2 * n_tags) * np.array(padding_steps)[None, :, None]
+        + (n_tags - 1) * np.array(gap_steps)[None, None, :]
+    )
+
+    # C-order flattening matches the font → padding → gap priority of the old nested loops
+    fits = (total <= safe_max_width).ravel()
+    if fits.any():
+        f, p, g = np.unravel_index(int(fits.argmax()), total.shape)
+        return font_steps[f], padding_steps[p], gap_steps[g]
+
+    # If nothing fits, return most aggressive shrinking
+    return font_steps[-1], padding_steps[-1], gap_steps[-1]
+
+
+# Professional block text heights in inches (title 10pt / company 9pt, line-height 1.2)
+_TITLE_H = {0: 0, 1: (10.0 * 1.2) / 72, 2: (10.0 * 1.2 * 2) / 72}
+_COMPANY_H = (9.0 * 1.2) / 72
+_COMPANY_MARGIN_TOP = 0.04
+
+# (color, display_type) for tag categories missing from the event config
+_DEFAULT_TAG_META = ('#E07A5F', 'standard')
+
+# Social platform names -> Font Awesome brand icon names
+_PLATFORM_MAP = MappingProxyType({
+    'linkedin': 'linkedin',
+    'twitter': 'x-twitter',
+    'x': 'x-twitter',
+    'github': 'github',
+    'instagram': 'instagram',
+    'facebook': 'facebook',
+    'youtube': 'youtube',
+    'tiktok': 'tiktok',
+})
+
+
+# Tag pill markup, pre-rendered in Python so Jinja only fills in the badge shell
+# (same markup the template's tag loops used to produce)
+_TOP_TAG_HTML = (
+    '<span class="tag" style="background-color: {color}; font-size: {font_size}pt; '
+    'padding: 0.06in {padding_h}in; margin-right: {gap}in;">{value}</span>'
+)
+_BOTTOM_TAG_HTML = (
+    '<span class="tag" style="background-color: {color}; font-size: {font_size}pt; '
+    'padding: 0.06in {padding_h}in;">{value}</span>'
+)
+
+
+def _tags_html(fragment: str, tags: list[dict], styling: dict) -> str:
+    """Render a row of tag pills from a format-string fragment."""
+    return "\n".join(
+        fragment.format(color=tag['color'], value=tag['value'], **styling) for tag in tags
+    )
+
+
+@lru_cache(maxsize=4)
+def _professional_positioning(title_lines: int) -> tuple[float, float, float]:
+    """
+    Professional block layout for a title line count (0, 1 or 2).
+
+    Returns:
+        (professional_top, graphic_offset, total_content_height)
+    """
+    # Professional block starts after separator
+    # Separator at 1.75in, add 0.08in gap to mirror gap above separator
+    professional_top = 1.83
+    graphic_size = 0.4
+
+    # Total text block height
+    total_height = _TITLE_H[title_lines] + _COMPANY_MARGIN_TOP + _COMPANY_H
+
+    # Center graphic with text block
+    text_center = total_height / 2
+    graphic_offset = text_center - (graphic_size / 2)
+
+    return professional_top, graphic_offset, total_height
+
+
+def _interests_band_geometry(title_lines: int) -> dict:
+    """
+    Interests band placement for a title line count (0, 1 or 2).
+
+    The band sits below the professional block and shrinks (keeping 2:1) if it
+    would run into the bottom tag row, so it only depends on title_lines.
+
+    Returns:
+        Template context values (inches) for the interests band
+    """
+    # Calculate where professional block ends (starts at 1.83in, below the separator)
+    professional_top, _, total_content_height = _professional_positioning(title_lines)
+    professional_bottom = professional_top + total_content_height
+
+    # Desired gap before interests band
+    desired_gap = 0.10  # Gap between professional block and interests
+
+    # Calculate interests band top position
+    interests_top = professional_bottom + desired_gap
+
+    # Interests band dimensions
+    badge_height = 4.0  # inches
+    interests_band_height = 1.35  # inches
+
+    # Bottom tags constraints - they're positioned at bottom: 0.15in with ~0.23in total height
+    # This means tags top is at ~4.0 - 0.15 - 0.23 = 3.62in from top
+    bottom_tags_top = 3.62  # Top edge of bottom tags
+    min_gap_to_tags = 0.10  # Minimum gap between interests band and tags
+
+    # Calculate maximum allowed bottom edge of interests band
+    max_interests_bottom_edge = bottom_tags_top - min_gap_to_tags  # 3.52in from top
+
+    # Calculate available height for interests band
+    available_height = max_interests_bottom_edge - interests_top
+
+    # Scale down interests band if it won't fit (maintaining 2:1 aspect ratio)
+    if available_height < interests_band_height:
+        # Scale proportionally to fit available space
+        scale_factor = available_height / interests_band_height
+        scaled_height = available_height
+        scaled_width = 2.7 * scale_factor  # Maintain 2:1 aspect ratio
+
+        # Center horizontally when scaled down
+        left_offset = (2.7 - scaled_width) / 2
+    else:
+        # Use full size
+        scaled_height = interests_band_height
+        scaled_width = 2.7
+        left_offset = 0
+
+    # Calculate bottom position (distance from bottom edge)
+    interests_bottom = badge_height - interests_top - scaled_height
+
+    return {
+        'interests_bottom': interests_bottom,
+        'interests_width': scaled_width,
+        'interests_height': scaled_height,
+        'interests_left_offset': left_offset,
+    }
+
+
+# Interests band geometry precomputed for each possible title line count
+_INTERESTS_GEOMETRY = {
+    title_lines: MappingProxyType(_interests_band_geometry(title_lines))
+    for title_lines in (0, 1, 2)
+}
+
+
 class BadgeRendererHTML:
     """Renders badges using HTML/CSS templates and WeasyPrint."""
 
@@ -27,7 +397,8 @@ class BadgeRendererHTML:
                  event_date: str = "", sponsor: str = "",
                  event_logo_path: Optional[str] = None,
                  sponsor_logo_path: Optional[str] = None,
-                 tags: Optional[list[TagCategory]] = None):
+                 tags: Optional[list[TagCategory]] = None,
+                 cached_locations_only: bool = False):
         """
         Initialize the HTML badge renderer.
 
@@ -40,6 +411,9 @@ class BadgeRendererHTML:
             event_logo_path: Path to event logo image
             sponsor_logo_path: Path to sponsor logo image
             tags: List of tag categories with colors and display types
+            cached_locations_only: Only use already-cached location normalizations
+                and graphics, never querying Nominatim (render_many workers, after
+                the parent has prewarmed the batch)
         """
         self.template_dir = Path(template_dir)
         self.event_id = event_id
@@ -50,50 +424,32 @@ class BadgeRendererHTML:
         self.sponsor_logo_path = sponsor_logo_path
         self.tags = tags or []
 
-        # Load HTML template
-        html_path = self.template_dir / "template.html"
-        with open(html_path, 'r', encoding='utf-8') as f:
-            self.html_template = Template(f.read())
+        # Absolute logo paths for the template, resolved once per renderer
+        self._event_logo_abs = Path(event_logo_path).absolute() if event_logo_path else None
+        self._sponsor_logo_abs = Path(sponsor_logo_path).absolute() if sponsor_logo_path else None
+
+        # Event working directory (per-attendee generated images live under it)
+        from src.utils.paths import get_working_dir
+        self._working_root = get_working_dir(event_id).absolute()
+
+        # Load HTML template (compiled once per template directory)
+        self.html_template = _get_template_env(str(self.template_dir)).get_template("template.html")
 
-        # Load CSS
+        # Load CSS (parsed once per file version)
         css_path = self.template_dir / "styles.css"
-        with open(css_path, 'r', encoding='utf-8') as f:
-            self.css_content = f.read()
+        self.css = _load_css(str(css_path), css_path.stat().st_mtime)
 
-        # Build tag color and display_type mapping from tags
-        self.tag_color_map = {}
-        self.tag_display_type_map = {}
-        for category in self.tags:
-            self.tag_color_map[category.name] = category.color
-            self.tag_display_type_map[category.name] = category.display_type
+        # Build tag category -> (color, display_type) lookup from tags
+        self.tag_meta = {category.name: (category.color, category.display_type) for category in self.tags}
+        self.tag_color_map = {name: color for name, (color, _) in self.tag_meta.items()}
 
         # Cache directory for location graphics
         from src.utils.paths import get_location_graphics_dir
-        self.location_cache_dir = get_location_graphics_dir()
+        self.location_cache_dir = get_location_graphics_dir().absolute()
 
         # Location normalizer for handling user input
         self.location_normalizer = LocationNormalizer()
-
-    def _make_qr(self, url: str, box_size: int = 6, border: int = 2) -> Image.Image:
-        """Generate a QR code image."""
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=box_size,
-            border=border
-        )
-        qr.add_data(url or "")
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        return img
-
-    def _image_to_data_uri(self, img: Image.Image, format: str = "PNG") -> str:
-        """Convert PIL Image to base64 data URI."""
-        buffer = io.BytesIO()
-        img.save(buffer, format=format)
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        return f"data:image/{format.lower()};base64,{img_base64}"
+        self.cached_locations_only = cached_locations_only
 
     def _get_location_graphic(self, location_str: str) -> Optional[Path]:
         """
@@ -112,19 +468,25 @@ class BadgeRendererHTML:
             return None
 
         # Normalize location to standard format (e.g., "Columbus, OH")
-        normalized_location = self.location_normalizer.normalize(location_str)
+        if self.cached_locations_only:
+            normalized_location = self.location_normalizer.cache.get(location_str) or None
+        else:
+            normalized_location = self.location_normalizer.normalize(location_str)
 
         if not normalized_location:
             print(f"  Warning: Could not normalize location: {location_str}")
             return None
 
-        # Create cache filename from normalized location
-        cache_filename = normalized_location.replace(", ", "_").replace(" ", "_") + ".svg"
-        cache_path = self.location_cache_dir / cache_filename
+        return self._get_normalized_location_graphic(normalized_location)
 
+    def _get_normalized_location_graphic(self, normalized_location: str) -> Optional[Path]:
+        """Return the cached graphic for an already-normalized location, rendering it if missing."""
         # Return cached version if it exists
+        cache_path = self._location_cache_path(normalized_location)
         if cache_path.exists():
-            return cache_path.absolute()
+            return cache_path
+        if self.cached_locations_only:
+            return None
 
         # Generate new graphic using normalized location
         result = render_location_graphic(
@@ -137,6 +499,51 @@ class BadgeRendererHTML:
             return result.absolute()
         return None
 
+    def _location_cache_path(self, normalized_location: str) -> Path:
+        """Cache file for a normalized location (e.g. "Columbus, OH" -> Columbus_OH.svg)."""
+        cache_filename = normalized_location.replace(", ", "_").replace(" ", "_") + ".svg"
+        return self.location_cache_dir / cache_filename
+
+    def prewarm_locations(self, attendees: list[Attendee], max_workers: int = 8) -> int:
+        """
+        Generate missing location graphics for a batch of attendees up front.
+
+        Call before a render loop so cold-cache locations are rendered concurrently
+        instead of stalling each badge in turn. Normalization stays sequential
+        since LocationNormalizer rewrites its cache file on every miss, and the
+        shared geocoder and boundary data are built - and the missing locations
+        geocoded as one batch - on this thread before the pool starts (see
+        preload_location_resources).
+
+        Args:
+            attendees: Attendees about to be rendered
+            max_workers: Threads used for graphic generation
+
+        Returns:
+            Number of locations that needed generating
+        """
+        missing = set()
+        for location in {a.location for a in attendees if a.location}:
+            normalized_location = self.location_normalizer.normalize(location)
+            if normalized_location and not self._location_cache_path(normalized_location).exists():
+                missing.add(normalized_location)
+
+        if missing:
+            try:
+                preload_location_resources(sorted(missing))
+            except Exception as e:
+                # Leave the graphics to the render loop, which reports per-location failures
+                print(f"  Warning: Could not preload location data: {e}")
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(self._get_normalized_location_graphic, missing))
+
+        return len(missing)
+
+    def _interests_image_path(self, attendee_id: str) -> Path:
+        """Convention-based path of an attendee's generated interests illustration."""
+        return self._working_root / attendee_id / "generated_images" / "interests_illustration.png"
+
     def _calculate_title_lines(self, title: Optional[str]) -> int:
         """
         Calculate how many lines a title will occupy.
@@ -152,23 +559,7 @@ class BadgeRendererHTML:
         """
         if not title or not title.strip():
             return 0
-
-        # Title constraints from styles.css
-        max_width_inches = 2.2  # Width available for title (to right of location graphic)
-        font_size = 10.0  # Title font size
-        font_name = "Helvetica"
-
-        # Measure rendered width
-        width_pts = pdfmetrics.stringWidth(title, font_name, font_size)
-        width_inches = width_pts / 72.0
-
-        # Conservative threshold: if within 5% of max, assume it wraps
-        safety_margin = 0.05 * max_width_inches
-
-        if width_inches <= (max_width_inches - safety_margin):
-            return 1
-        else:
-            return 2  # CSS line-clamp limits to 2 max
+        return _title_line_count(title, 10.0)
 
     def _validate_micro_tag(self, category_name: str, value: str, max_chars: int = 5) -> None:
         """
@@ -215,108 +606,14 @@ class BadgeRendererHTML:
         Returns:
             dict with font_size (float), padding_h (float), gap (float) values in inches/points
         """
-        if not tag_values:
-            return {'font_size': 8, 'padding_h': 0.12, 'gap': 0.08}
-
-        # Default styling
-        base_font_size = 8
-        base_padding_h = 0.12
-        base_padding_v = 0.06
-        base_gap = 0.08
-        border_radius = 0.08
-        font_name = "Helvetica"
-        font_weight = 600  # Using semibold weight
-
-        # Safety margin: pdfmetrics.stringWidth doesn't account for bold/semibold rendering
-        # which makes text slightly wider. Add 7% safety margin.
-        safety_factor = 0.93  # Use 93% of max_width to ensure tags don't overflow
-        safe_max_width = max_width * safety_factor
-
-        # Progressive reduction steps
-        gap_steps = [0.08, 0.06, 0.04]
-        padding_steps = [0.12, 0.10, 0.08]
-        font_steps = [8, 7.5, 7]
-
-        # Try each combination until we find one that fits
-        for font_size in font_steps:
-            for padding_h in padding_steps:
-                for gap in gap_steps:
-                    total_width = 0
-
-                    for i, tag_text in enumerate(tag_values):
-                        # Calculate text width
-                        text_width_pts = pdfmetrics.stringWidth(tag_text, font_name, font_size)
-                        text_width_in = text_width_pts / 72.0
-
-                        # Tag width = padding + text + padding
-                        tag_width = (padding_h * 2) + text_width_in
-                        total_width += tag_width
-
-                        # Add gap after each tag except the last
-                        if i < len(tag_values) - 1:
-                            total_width += gap
-
-                    # Check if this configuration fits within safe max width
-                    if total_width <= safe_max_width:
-                        return {
-                            'font_size': font_size,
-                            'padding_h': padding_h,
-                            'gap': gap
-                        }
-
-        # If nothing fits, return most aggressive shrinking
+        font_size, padding_h, gap = _tag_row_styling(tuple(tag_values), max_width)
         return {
-            'font_size': 7,
-            'padding_h': 0.08,
-            'gap': 0.04
+            'font_size': font_size,
+            'padding_h': padding_h,
+            'gap': gap
         }
 
-    def _calculate_professional_positioning(self, title: Optional[str]) -> dict:
-        """
-        Calculate positioning for professional info block with vertical centering.
-
-        Returns:
-            dict with professional_top and graphic_offset values
-        """
-        title_lines = self._calculate_title_lines(title)
-
-        # Professional block starts after separator
-        # Separator at 1.75in, add 0.08in gap to mirror gap above separator
-        professional_top = 1.83
-
-        # Font size and line height constants
-        title_font_pt = 10.0
-        title_line_height = 1.2
-        company_font_pt = 9.0
-        company_line_height = 1.2
-        company_margin_top = 0.04
-        graphic_size = 0.4
-
-        # Calculate title height in inches
-        if title_lines == 0:
-            title_height = 0
-        elif title_lines == 1:
-            title_height = (title_font_pt * title_line_height) / 72
-        else:  # 2 lines
-            title_height = (title_font_pt * title_line_height * 2) / 72
-
-        # Company height in inches
-        company_height = (company_font_pt * company_line_height) / 72
-
-        # Total text block height
-        total_height = title_height + company_margin_top + company_height
-
-        # Center graphic with text block
-        text_center = total_height / 2
-        graphic_offset = text_center - (graphic_size / 2)
-
-        return {
-            'professional_top': professional_top,
-            'graphic_offset': graphic_offset
-        }
-
-    def _prepare_badge_html(self, attendee: Attendee,
-                            tags: Optional[dict[str, str]] = None) -> str:
+    def _prepare_badge_html(self, attendee: Attendee, tags: Optional[dict[str, str]] = None) -> str:
         """
         Prepare badge HTML content (internal method used by both render_badge and render_badge_html).
 
@@ -327,11 +624,8 @@ class BadgeRendererHTML:
         Returns:
             Rendered HTML string
         """
-        # Generate QR code as data URI
-        qr_code_data_uri = None
-        if attendee.profile_url:
-            qr_img = self._make_qr(attendee.profile_url)
-            qr_code_data_uri = self._image_to_data_uri(qr_img)
+        # Generate QR code as inline SVG
+        qr_code_svg = _qr_svg(attendee.profile_url) if attendee.profile_url else None
 
         # Get optimized display name with smart truncation
         name_info = get_display_name(
@@ -342,75 +636,9 @@ class BadgeRendererHTML:
             min_font_size=12.0
         )
 
-        # Calculate title lines and interests band position
-        # Position interests band based on title lines for optimal spacing
+        # Layout that depends only on how many lines the title wraps to (0, 1 or 2)
         title_lines = self._calculate_title_lines(attendee.title)
-
-        # Calculate professional block positioning for vertical centering
-        prof_layout = self._calculate_professional_positioning(attendee.title)
-
-        # Calculate interests_bottom dynamically based on professional block height
-        # Professional block starts at 1.75in, we need to calculate where it ends
-        professional_top = prof_layout['professional_top']
-
-        # Calculate content height (same logic as in _calculate_professional_positioning)
-        title_font_pt = 10.0
-        title_line_height = 1.2
-        company_font_pt = 9.0
-        company_line_height = 1.2
-        company_margin_top = 0.04
-
-        if title_lines == 0:
-            title_height = 0
-        elif title_lines == 1:
-            title_height = (title_font_pt * title_line_height) / 72
-        else:
-            title_height = (title_font_pt * title_line_height * 2) / 72
-
-        company_height = (company_font_pt * company_line_height) / 72
-        total_content_height = title_height + company_margin_top + company_height
-
-        # Calculate where professional block ends
-        professional_bottom = professional_top + total_content_height
-
-        # Desired gap before interests band
-        desired_gap = 0.10  # Gap between professional block and interests
-
-        # Calculate interests band top position
-        interests_top = professional_bottom + desired_gap
-
-        # Interests band dimensions
-        badge_height = 4.0  # inches
-        interests_band_height = 1.35  # inches
-
-        # Bottom tags constraints - they're positioned at bottom: 0.15in with ~0.23in total height
-        # This means tags top is at ~4.0 - 0.15 - 0.23 = 3.62in from top
-        bottom_tags_top = 3.62  # Top edge of bottom tags
-        min_gap_to_tags = 0.10  # Minimum gap between interests band and tags
-
-        # Calculate maximum allowed bottom edge of interests band
-        max_interests_bottom_edge = bottom_tags_top - min_gap_to_tags  # 3.52in from top
-
-        # Calculate available height for interests band
-        available_height = max_interests_bottom_edge - interests_top
-
-        # Scale down interests band if it won't fit (maintaining 2:1 aspect ratio)
-        if available_height < interests_band_height:
-            # Scale proportionally to fit available space
-            scale_factor = available_height / interests_band_height
-            scaled_height = available_height
-            scaled_width = 2.7 * scale_factor  # Maintain 2:1 aspect ratio
-
-            # Center horizontally when scaled down
-            left_offset = (2.7 - scaled_width) / 2
-        else:
-            # Use full size
-            scaled_height = interests_band_height
-            scaled_width = 2.7
-            left_offset = 0
-
-        # Calculate bottom position (distance from bottom edge)
-        interests_bottom = badge_height - interests_top - scaled_height
+        professional_top, graphic_offset, _ = _professional_positioning(title_lines)
 
         # Generate location graphic if location exists
         location_graphic_path = None
@@ -420,18 +648,7 @@ class BadgeRendererHTML:
         # Map social platform to Font Awesome icon name
         social_platform = None
         if attendee.preferred_social_platform:
-            # Map platform names to Font Awesome brand icon names
-            platform_map = {
-                'linkedin': 'linkedin',
-                'twitter': 'x-twitter',
-                'x': 'x-twitter',
-                'github': 'github',
-                'instagram': 'instagram',
-                'facebook': 'facebook',
-                'youtube': 'youtube',
-                'tiktok': 'tiktok',
-            }
-            social_platform = platform_map.get(attendee.preferred_social_platform.lower())
+            social_platform = _PLATFORM_MAP.get(attendee.preferred_social_platform.lower())
 
         # Get interests image using convention-based path
         # Interests images are OPTIONAL - only required if attendee has interests
@@ -444,11 +661,7 @@ class BadgeRendererHTML:
         )
 
         if has_interests:
-            from src.utils.paths import get_working_dir
-            interests_image_path = (
-                get_working_dir(self.event_id, attendee.id) /
-                "generated_images" / "interests_illustration.png"
-            )
+            interests_image_path = self._interests_image_path(attendee.id)
 
             if not interests_image_path.exists():
                 raise FileNotFoundError(
@@ -466,7 +679,7 @@ class BadgeRendererHTML:
         micro_badge = None  # Will hold micro-tag for special positioning
 
         for category_name, value in tag_items:
-            display_type = self.tag_display_type_map.get(category_name, "standard")
+            color, display_type = self.tag_meta.get(category_name, _DEFAULT_TAG_META)
 
             # Validate micro-tag character limit
             if display_type == "micro":
@@ -476,7 +689,7 @@ class BadgeRendererHTML:
                     micro_badge = {
                         'category': category_name,
                         'value': value,
-                        'color': self.tag_color_map.get(category_name, '#E07A5F')
+                        'color': color
                     }
                     continue  # Skip adding to tag_metadata - it'll be positioned separately
 
@@ -484,12 +697,10 @@ class BadgeRendererHTML:
                 'category': category_name,
                 'value': value,
                 'display_type': display_type,
-                'color': self.tag_color_map.get(category_name, '#E07A5F')
+                'color': color
             })
 
         # Top row: first 2 tags (excluding micro-tag)
-        top_tag_values = [value for _, value in tag_items[:2] if self.tag_display_type_map.get(_[0] if isinstance(_, tuple) else _, "standard") != "micro"]
-        # Need to get values from tag_metadata instead
         top_tags = [t for t in tag_metadata[:2]]
         top_tag_values = [t['value'] for t in top_tags]
         top_tag_styling = self._calculate_tag_row_styling(top_tag_values)
@@ -516,8 +727,8 @@ class BadgeRendererHTML:
             'event_name': self.event_name,
             'event_date': self.event_date,
             'sponsor': self.sponsor,
-            'event_logo_path': Path(self.event_logo_path).absolute() if self.event_logo_path else None,
-            'sponsor_logo_path': Path(self.sponsor_logo_path).absolute() if self.sponsor_logo_path else None,
+            'event_logo_path': self._event_logo_abs,
+            'sponsor_logo_path': self._sponsor_logo_abs,
             'name': name_info['text'],
             'name_font_size': name_info['font_size'],
             'title': attendee.title,
@@ -533,16 +744,16 @@ class BadgeRendererHTML:
             'tag_colors': self.tag_color_map,
             'top_tag_styling': top_tag_styling,
             'bottom_tag_styling': bottom_tag_styling,
-            'qr_code_data_uri': qr_code_data_uri,
-            'interests_image_path': interests_image_path.absolute() if interests_image_path else None,
-            'interests_bottom': interests_bottom,
-            'interests_width': scaled_width,
-            'interests_height': scaled_height,
-            'interests_left_offset': left_offset,
-            'professional_top': prof_layout['professional_top'],
-            'graphic_offset': prof_layout['graphic_offset'],
+            'top_tags_html': _tags_html(_TOP_TAG_HTML, top_tags, top_tag_styling),
+            'bottom_tags_html': _tags_html(_BOTTOM_TAG_HTML, bottom_tags, bottom_tag_styling),
+            'qr_code_svg': qr_code_svg,
+            'interests_image_path': interests_image_path,
+            'professional_top': professional_top,
+            'graphic_offset': graphic_offset,
         }
 
+        context.update(_INTERESTS_GEOMETRY[title_lines])
+
         # Render HTML
         html_content = self.html_template.render(**context)
         return html_content
@@ -580,9 +791,37 @@ class BadgeRendererHTML:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         HTML(string=html_content, base_url=str(self.template_dir)).write_pdf(
             str(output_path),
-            stylesheets=[CSS(string=self.css_content)]
+            stylesheets=[self.css],
+            font_config=_FONT_CONFIG
         )
 
+    @classmethod
+    def render_many(cls, init_kwargs: dict,
+                    jobs: list[tuple[Attendee, Optional[dict[str, str]], Path]],
+                    max_workers: Optional[int] = None) -> list[tuple[Path, Optional[str]]]:
+        """
+        Render many badges to individual PDFs in parallel worker processes.
+
+        Each worker builds one renderer from init_kwargs and reuses it for every
+        job it receives, so template/CSS/location state is set up once per core.
+        Locations are normalized, geocoded and drawn here first (prewarm_locations),
+        and the workers only read those caches: one process talks to Nominatim,
+        so the batch stays within its one-request-per-second policy.
+
+        Args:
+            init_kwargs: Keyword arguments for BadgeRendererHTML(...)
+            jobs: (attendee, tags, output_path) triples
+            max_workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            (output_path, error) per job in input order; error is None on success
+        """
+        cls(**init_kwargs).prewarm_locations([attendee for attendee, _, _ in jobs])
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker,
+                                 initargs=(cls, init_kwargs)) as executor:
+            return list(executor.map(_render_worker_job, jobs))
+
     def render_to_bytes(self, event: 'Event', attendee: Attendee,
                         event_attendee: 'EventAttendee') -> bytes:
         """
@@ -601,7 +840,30 @@ class BadgeRendererHTML:
 
         # Generate PDF with WeasyPrint and return as bytes
         pdf_bytes = HTML(string=html_content, base_url=str(self.template_dir)).write_pdf(
-            stylesheets=[CSS(string=self.css_content)]
+            stylesheets=[self.css],
+            font_config=_FONT_CONFIG
         )
 
         return pdf_bytes
+
+
+# Per-process renderer used by BadgeRendererHTML.render_many workers
+_worker_renderer: Optional[BadgeRendererHTML] = None
+
+
+def _init_render_worker(renderer_cls: type, init_kwargs: dict) -> None:
+    """Process pool initializer: build this worker's renderer once."""
+    global _worker_renderer
+    _worker_renderer = renderer_cls(**init_kwargs, cached_locations_only=True)
+    # Forked pool workers exit without running atexit handlers; finalizers do run
+    multiprocessing.util.Finalize(None, _save_layout_cache, exitpriority=10)
+
+
+def _render_worker_job(job: tuple[Attendee, Optional[dict[str, str]], Path]) -> tuple[Path, Optional[str]]:
+    """Render one badge in a worker, reporting failures instead of aborting the batch."""
+    attendee, tags, output_path = job
+    try:
+        _worker_renderer.render_badge(attendee, output_path, tags)
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
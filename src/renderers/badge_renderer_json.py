@@ -4,17 +4,29 @@ Badge renderer that works with JSON template format.
 Simpler, more flexible than the YAML-based system.
 """
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import numpy as np
 from PIL import Image
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
+import io
 import qrcode
 
+try:
+    import segno
+    SEGNO_AVAILABLE = True
+except ImportError:
+    SEGNO_AVAILABLE = False
+
 from ..models import Attendee, TagCategory
+from ..utils.font_metrics import helvetica_text_width
 
 
 def _pt(inches_val: float) -> float:
@@ -22,13 +34,85 @@ def _pt(inches_val: float) -> float:
     return inches_val * inch
 
 
+@lru_cache(maxsize=None)
 def _hex_to_rgb(hex_color: str) -> tuple:
-    """Convert hex color like '#3D405B' to RGB tuple (0-1 range)."""
+    """Convert hex color like '#3D405B' to RGB tuple (0-1 range). Cached per color string."""
     hex_color = hex_color.lstrip('#')
     r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
     return (r/255.0, g/255.0, b/255.0)
 
 
+@lru_cache(maxsize=512)
+def _qr_image(url: str, box_size: int = 6, border: int = 2) -> Image.Image:
+    """Generate a QR code image (cached per URL; don't mutate the result)."""
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=box_size,
+        border=border
+    )
+    qr.add_data(url or "")
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    if not isinstance(img, Image.Image):
+        img = img.convert("RGB")
+    return img
+
+
+@lru_cache(maxsize=512)
+def _qr_image_reader(url: str, box_size: int = 6, border: int = 2) -> ImageReader:
+    """
+    ReportLab reader for a URL's QR code, so the raster conversion also runs once.
+
+    Uses segno when installed: it writes the PNG directly without building a PIL
+    image. Otherwise it falls back to qrcode + PIL.
+    """
+    if SEGNO_AVAILABLE:
+        buffer = io.BytesIO()
+        segno.make_qr(url or "", error='m', boost_error=False).save(
+            buffer, kind='png', scale=box_size, border=border
+        )
+        buffer.seek(0)
+        return ImageReader(buffer)
+    return ImageReader(_qr_image(url, box_size, border))
+
+
+def _truncate_to_fit(text: str, font_family: str, font_size: float,
+                     max_w: float) -> tuple[str, float]:
+    """
+    Longest prefix of text that would fit in max_w with a trailing ellipsis.
+
+    Same output as the original trim-one-character-at-a-time loop: room for
+    the ellipsis is reserved but the ellipsis itself is not drawn, and text is
+    left whole when it fits with that room to spare. Binary search over the
+    prefix length (widths grow monotonically with it), so an overflowing
+    field costs O(log n) width measurements.
+
+    Returns:
+        (display_text, width) - empty string if not even one character fits
+    """
+    def fits(n: int) -> bool:
+        return stringWidth(text[:n] + "…", font_family, font_size) <= max_w
+
+    if fits(len(text)):
+        lo = len(text)
+    else:
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid - 1
+    display_text = text[:lo]
+    return display_text, stringWidth(display_text, font_family, font_size)
+
+
+# Form XObject names for the event-wide parts of every badge
+_EVENT_TEXT_FORM = "event_text"
+_EVENT_LOGOS_FORM = "event_logos"
+
+
 class BadgeRendererJSON:
     """Renders badges using JSON template format."""
 
@@ -50,53 +134,79 @@ class BadgeRendererJSON:
         self.dimensions = template.get("dimensions", {"width": 3, "height": 4})
         self.tag_style = template.get("tagStyle", {})
 
+        # Page size and QR placement in points
+        self._pagesize = (_pt(self.dimensions.get("width", 3)), _pt(self.dimensions.get("height", 4)))
+        qr_cfg = self.layout.get("qr_code")
+        self._qr_zone = (_pt(qr_cfg["x"]), _pt(qr_cfg["y"]), _pt(qr_cfg["size"])) if qr_cfg else None
+
+        # Placeholder fills for missing logos / interests image
+        palette = self.tmpl.get("colorPalette", {})
+        self._logo_color = palette.get("warmOrange", "#E07A5F")
+        self._interest_color = palette.get("teal", "#81B29A")
+
+        # Category name -> pre-converted RGB fill for tags
+        self.category_rgb = {cat.name: _hex_to_rgb(cat.color) for cat in self.tag_categories}
+
+        # Text fields: (x, y, max_w, align, font_family, font_size, rgb), positions in points
+        self._text_fields = {}
+        for field_name, layout in self.layout.items():
+            if field_name not in self.fonts:
+                continue
+            font_cfg = self.fonts[field_name]
+            self._text_fields[field_name] = (
+                _pt(layout["x"]),
+                _pt(layout["y"]),
+                _pt(layout["max_width"]),
+                layout.get("align", "left"),
+                font_cfg.get("family", "Helvetica"),
+                font_cfg.get("size", 10),
+                _hex_to_rgb(font_cfg.get("color", "#000000"))
+            )
+
+        # Image zones: (x, y, w, h) in points
+        self._image_zones = {
+            zone_name: (_pt(zone["x"]), _pt(zone["y"]), _pt(zone["w"]), _pt(zone["h"]))
+            for zone_name, zone in self.layout.items()
+            if "w" in zone and "h" in zone
+        }
+
+        # Tag row: (x_start, y_pos, gap, max_w) and style (default_bg_rgb, text_rgb, font_size, pad_h, pad_v, radius)
+        tags_layout = self.layout.get("tags")
+        self._tags_layout = (
+            _pt(tags_layout["x"]),
+            _pt(tags_layout["y"]),
+            _pt(tags_layout.get("gap", 0.08)),
+            _pt(tags_layout.get("max_width", 2.7))
+        ) if tags_layout else None
+        self._tag_style = (
+            _hex_to_rgb(self.tag_style.get("bg_color", "#E07A5F")),
+            _hex_to_rgb(self.tag_style.get("text_color", "#FFFFFF")),
+            self.tag_style.get("font_size", 7),
+            _pt(self.tag_style.get("padding_h", 0.08)),
+            _pt(self.tag_style.get("padding_v", 0.04)),
+            _pt(self.tag_style.get("radius", 0.05))
+        )
+
     def _make_qr(self, url: str, box_size: int = 6, border: int = 2) -> Image.Image:
         """Generate a QR code image."""
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=box_size,
-            border=border
-        )
-        qr.add_data(url or "")
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        if not isinstance(img, Image.Image):
-            img = img.convert("RGB")
-        return img
+        return _qr_image(url, box_size, border)
 
     def _draw_text(self, c: canvas.Canvas, field_name: str, text: str) -> None:
         """Draw a text field using layout and font config."""
-        if not text or field_name not in self.layout or field_name not in self.fonts:
+        if not text or field_name not in self._text_fields:
             return
 
-        layout = self.layout[field_name]
-        font_cfg = self.fonts[field_name]
-
-        x = _pt(layout["x"])
-        y = _pt(layout["y"])
-        max_w = _pt(layout["max_width"])
-        align = layout.get("align", "left")
-
-        font_family = font_cfg.get("family", "Helvetica")
-        font_size = font_cfg.get("size", 10)
-        color = font_cfg.get("color", "#000000")
+        x, y, max_w, align, font_family, font_size, (r, g, b) = self._text_fields[field_name]
 
         # Set color
-        r, g, b = _hex_to_rgb(color)
         c.setFillColorRGB(r, g, b)
         c.setFont(font_family, font_size)
 
-        # Handle text overflow with ellipsis
-        display_text = text
-        while display_text and c.stringWidth(display_text + "…", font_family, font_size) > max_w:
-            display_text = display_text[:-1]
-        if display_text and c.stringWidth(display_text, font_family, font_size) > max_w:
-            display_text = display_text[:-1] + "…"
+        # Handle text overflow
+        display_text, sw = _truncate_to_fit(text, font_family, font_size, max_w)
 
         # Apply alignment
         if align == "center":
-            sw = c.stringWidth(display_text, font_family, font_size)
             x = x + (max_w - sw) / 2.0
 
         c.drawString(x, y, display_text)
@@ -107,18 +217,14 @@ class BadgeRendererJSON:
     def _draw_image(self, c: canvas.Canvas, zone_name: str, image_path: Optional[str],
                     placeholder_color: str = "#CCCCCC") -> None:
         """Draw an image or placeholder in the specified zone."""
-        if zone_name not in self.layout:
+        if zone_name not in self._image_zones:
             return
 
         # Skip drawing if no image path is provided
         if not image_path:
             return
 
-        zone = self.layout[zone_name]
-        x = _pt(zone["x"])
-        y = _pt(zone["y"])
-        w = _pt(zone["w"])
-        h = _pt(zone["h"])
+        x, y, w, h = self._image_zones[zone_name]
 
         if Path(image_path).exists():
             # Draw actual image
@@ -147,47 +253,32 @@ class BadgeRendererJSON:
 
     def _draw_tags(self, c: canvas.Canvas, tags: dict[str, str]) -> None:
         """Draw tags with colors from their categories."""
-        if not tags or "tags" not in self.layout:
+        if not tags or self._tags_layout is None:
             return
 
-        layout = self.layout["tags"]
-        x_start = _pt(layout["x"])
-        y_pos = _pt(layout["y"])
-        gap = _pt(layout.get("gap", 0.08))
-        max_w = _pt(layout.get("max_width", 2.7))
-
-        # Style defaults
-        default_bg_color = self.tag_style.get("bg_color", "#E07A5F")
-        text_color = self.tag_style.get("text_color", "#FFFFFF")
-        font_size = self.tag_style.get("font_size", 7)
-        pad_h = _pt(self.tag_style.get("padding_h", 0.08))
-        pad_v = _pt(self.tag_style.get("padding_v", 0.04))
-        radius = _pt(self.tag_style.get("radius", 0.05))
-
-        text_r, text_g, text_b = _hex_to_rgb(text_color)
-
-        # Build category name -> color mapping
-        category_colors = {}
-        for cat in self.tag_categories:
-            category_colors[cat.name] = cat.color
+        x_start, y_pos, gap, max_w = self._tags_layout
+        default_bg_rgb, (text_r, text_g, text_b), font_size, pad_h, pad_v, radius = self._tag_style
 
         font_family = "Helvetica"
         c.setFont(font_family, font_size)
-        cur_x = x_start
 
-        # Render each tag value with its category's color
-        for category_name, tag_value in tags.items():
+        # Lay out the whole row at once: left edge of each tag, and how many fit before max width
+        items = list(tags.items())
+        badge_widths = np.fromiter(
+            (helvetica_text_width(tag_value, font_size) for _, tag_value in items),
+            dtype=np.float64, count=len(items)
+        ) + (pad_h * 2)
+        x_positions = x_start + np.concatenate(([0.0], np.cumsum(badge_widths[:-1] + gap)))
+        cutoff = int(np.searchsorted(x_positions + badge_widths, x_start + max_w, side='right'))
+        badge_h = font_size + (pad_v * 2)
+        text_y = y_pos + pad_v + font_size * 0.2
+
+        # Render each tag value that fits with its category's color
+        for (category_name, tag_value), cur_x, badge_w in zip(
+            items[:cutoff], x_positions[:cutoff].tolist(), badge_widths[:cutoff].tolist()
+        ):
             # Get color for this category, fallback to default
-            bg_color = category_colors.get(category_name, default_bg_color)
-            bg_r, bg_g, bg_b = _hex_to_rgb(bg_color)
-
-            text_w = c.stringWidth(tag_value, font_family, font_size)
-            badge_w = text_w + (pad_h * 2)
-            badge_h = font_size + (pad_v * 2)
-
-            # Check if we exceed max width
-            if cur_x + badge_w > x_start + max_w:
-                break
+            bg_r, bg_g, bg_b = self.category_rgb.get(category_name, default_bg_rgb)
 
             # Draw rounded rectangle with category color
             c.setFillColorRGB(bg_r, bg_g, bg_b)
@@ -195,24 +286,84 @@ class BadgeRendererJSON:
 
             # Draw text
             c.setFillColorRGB(text_r, text_g, text_b)
-            text_x = cur_x + pad_h
-            text_y = y_pos + pad_v + font_size * 0.2
-            c.drawString(text_x, text_y, tag_value)
-
-            cur_x += badge_w + gap
+            c.drawString(cur_x + pad_h, text_y, tag_value)
 
         # Reset color
         c.setFillColorRGB(0, 0, 0)
 
+    def _new_canvas(self, output_path: Path) -> canvas.Canvas:
+        """Create a canvas sized to the badge dimensions, with the event forms defined."""
+        c = canvas.Canvas(str(output_path), pagesize=self._pagesize)
+        self._define_event_forms(c)
+        return c
+
+    def _define_event_forms(self, c: canvas.Canvas) -> None:
+        """
+        Record the parts shared by every badge in the event as form XObjects.
+
+        Each page places them with a single doForm call, so a batch PDF stores the
+        event text and logos once rather than once per badge. Text and logos are
+        separate forms to keep the stacking order (logos sit above the tag row).
+        """
+        c.beginForm(_EVENT_TEXT_FORM)
+        self._draw_text(c, "event_name", self.event_name)
+        self._draw_text(c, "event_date", self.event_date)
+        c.endForm()
+
+        c.beginForm(_EVENT_LOGOS_FORM)
+        self._draw_image(c, "event_logo", self.event_logo_path, self._logo_color)
+        self._draw_image(c, "sponsor_logo", self.sponsor_logo_path, self._logo_color)
+        c.endForm()
+
     def render_badge(self, attendee: Attendee, output_path: Path, tags: Optional[dict[str, str]] = None) -> None:
         """Render a complete badge to PDF."""
-        w_in = self.dimensions.get("width", 3)
-        h_in = self.dimensions.get("height", 4)
-        c = canvas.Canvas(str(output_path), pagesize=(_pt(w_in), _pt(h_in)))
+        c = self._new_canvas(output_path)
+        self._draw_badge(c, attendee, tags)
 
+        # Finalize PDF
+        c.showPage()
+        c.save()
+
+    def render_batch(self, items: list[tuple[Attendee, Optional[dict[str, str]]]], output_path: Path) -> None:
+        """
+        Render many badges into one multi-page PDF, one badge per page.
+
+        Shares a single canvas, so the PDF header, fonts and trailer are written once
+        for the whole batch instead of once per badge.
+        """
+        c = self._new_canvas(output_path)
+        for attendee, tags in items:
+            self._draw_badge(c, attendee, tags)
+            c.showPage()
+        c.save()
+
+    @classmethod
+    def render_all(cls, init_kwargs: dict,
+                   jobs: list[tuple[Attendee, Optional[dict[str, str]], Path]],
+                   max_workers: Optional[int] = None) -> list[tuple[Path, Optional[str]]]:
+        """
+        Render badges to individual PDFs in parallel worker processes.
+
+        Each worker builds one renderer from init_kwargs (via the pool initializer)
+        and reuses it for every job it receives, so only the constructor arguments
+        are pickled - this works with the spawn and forkserver start methods too.
+
+        Args:
+            init_kwargs: Keyword arguments for BadgeRendererJSON(...)
+            jobs: (attendee, tags, output_path) triples
+            max_workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            (output_path, error) per job in input order; error is None on success
+        """
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker,
+                                 initargs=(cls, init_kwargs)) as executor:
+            return list(executor.map(_render_worker_job, jobs))
+
+    def _draw_badge(self, c: canvas.Canvas, attendee: Attendee, tags: Optional[dict[str, str]] = None) -> None:
+        """Draw every element of one badge onto the current canvas page (from _new_canvas)."""
         # Draw text fields
-        self._draw_text(c, "event_name", self.event_name)
-        self._draw_text(c, "event_date", self.event_date)
+        c.doForm(_EVENT_TEXT_FORM)
         self._draw_text(c, "name", attendee.name)
         self._draw_text(c, "title", attendee.title or "")
         self._draw_text(c, "company", attendee.company or "")
@@ -223,28 +374,36 @@ class BadgeRendererJSON:
             self._draw_tags(c, tags)
 
         # Draw images
-        palette = self.tmpl.get("colorPalette", {})
-        logo_color = palette.get("warmOrange", "#E07A5F")
-        interest_color = palette.get("teal", "#81B29A")
-
-        self._draw_image(c, "event_logo", self.event_logo_path, logo_color)
-        self._draw_image(c, "sponsor_logo", self.sponsor_logo_path, logo_color)
-        self._draw_image(c, "interests_band", attendee.interests_image_path, interest_color)
+        c.doForm(_EVENT_LOGOS_FORM)
+        self._draw_image(c, "interests_band", attendee.interests_image_path, self._interest_color)
 
         # Draw QR code if configured and URL provided
-        if "qr_code" in self.layout and attendee.profile_url:
-            qr_cfg = self.layout["qr_code"]
-            qr_img = self._make_qr(attendee.profile_url)
-            qr_x = _pt(qr_cfg["x"])
-            qr_y = _pt(qr_cfg["y"])
-            qr_size = _pt(qr_cfg["size"])
+        if self._qr_zone is not None and attendee.profile_url:
+            qr_reader = _qr_image_reader(attendee.profile_url)
+            qr_x, qr_y, qr_size = self._qr_zone
             c.drawImage(
-                ImageReader(qr_img),
+                qr_reader,
                 qr_x, qr_y,
                 width=qr_size, height=qr_size,
                 preserveAspectRatio=True, mask="auto"
             )
 
-        # Finalize PDF
-        c.showPage()
-        c.save()
+
+# Per-process renderer used by BadgeRendererJSON.render_all workers
+_worker_renderer: Optional[BadgeRendererJSON] = None
+
+
+def _init_render_worker(renderer_cls: type, init_kwargs: dict) -> None:
+    """Process pool initializer: build this worker's renderer once."""
+    global _worker_renderer
+    _worker_renderer = renderer_cls(**init_kwargs)
+
+
+def _render_worker_job(job: tuple[Attendee, Optional[dict[str, str]], Path]) -> tuple[Path, Optional[str]]:
+    """Render one badge in a worker, reporting failures instead of aborting the batch."""
+    attendee, tags, output_path = job
+    try:
+        _worker_renderer.render_badge(attendee, output_path, tags)
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
@@ -8,17 +8,83 @@ This renderer creates 8.5"x11" landscape PDFs with a two-column layout:
 
 Used for showing clients/stakeholders sample input → sample output.
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 from datetime import datetime
 import base64
 from pdf2image import convert_from_path
+from pypdf import PdfWriter
 import io
+import tempfile
+
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
 
 from ..models import Event, Attendee, EventAttendee
 
+# One font configuration per process, shared by every stylesheet and write
+_FONT_CONFIG = FontConfiguration()
+
+# The badge is shown at 3"x4" on the sheet; 150 DPI is plenty for that size
+BADGE_PREVIEW_DPI = 150
+
+
+def _image_to_data_uri(image) -> str:
+    """Encode a PIL image as a base64 PNG data URI."""
+    # Convert to PNG bytes (fast, light compression - the sheet PDF recompresses anyway)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=False, compress_level=1)
+
+    # Encode as base64
+    image_base64 = base64.b64encode(buffer.getbuffer()).decode('utf-8')
+
+    # Return as data URI
+    return f"data:image/png;base64,{image_base64}"
+
+
+def _rasterize_first_page(pdf_path: Path, dpi: int = BADGE_PREVIEW_DPI):
+    """Render the first page of a PDF to a PIL image (in-process via pdfium when installed)."""
+    if PYPDFIUM2_AVAILABLE:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return pdf[0].render(scale=dpi / 72).to_pil()
+        finally:
+            pdf.close()
+
+    return convert_from_path(pdf_path, dpi=dpi, first_page=1, last_page=1)[0]
+
+
+@lru_cache(maxsize=8)
+def _load_css(css_path: str) -> CSS:
+    """Parse a stylesheet once per process."""
+    return CSS(filename=css_path, font_config=_FONT_CONFIG)
+
+
+def _init_sheet_worker(css_path: str) -> None:
+    """Process pool initializer: parse the sheet stylesheet before the first job arrives."""
+    _load_css(css_path)
+
+
+def _write_sheet_pdf(html_content: str, css_path: str, output_path: Path) -> None:
+    """Write a rendered sample sheet to PDF (module-level so worker processes can run it)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Preview sheets: skip presentational hints and image re-optimization
+    HTML(string=html_content).write_pdf(
+        output_path,
+        stylesheets=[_load_css(css_path)],
+        font_config=_FONT_CONFIG,
+        presentational_hints=False,
+        optimize_images=False
+    )
+
 
 class SampleSheetRenderer:
     """Generates sample sheet PDFs combining form data display with rendered badge."""
@@ -38,6 +104,11 @@ class SampleSheetRenderer:
         self.template_dir = template_dir
         self.env = Environment(loader=FileSystemLoader(str(template_dir)))
 
+        # Compile the template and parse the stylesheet once for all renders
+        self._template = self.env.get_template("template.html")
+        self._css_path = str(Path(template_dir) / "styles.css")
+        self._css = _load_css(self._css_path)
+
     def render(
         self,
         event: Event,
@@ -59,12 +130,108 @@ class SampleSheetRenderer:
         # Convert badge PDF to image
         badge_image_data = self._pdf_to_base64_image(badge_pdf_path)
 
+        html_content = self._render_html(event, attendee, event_attendee, badge_image_data)
+        _write_sheet_pdf(html_content, self._css_path, output_path)
+
+    def render_many(
+        self,
+        jobs: list[tuple[Event, Attendee, EventAttendee, Path, Path]],
+        max_workers: Optional[int] = None
+    ) -> list[tuple[Path, Optional[str]]]:
+        """
+        Render several sample sheets in one batch.
+
+        Badge PDFs are rasterized in-process with pdfium when it is installed;
+        otherwise they are merged and rasterized with a single pdf2image call
+        (one poppler process instead of one per badge). The sheet PDFs are
+        written by a pool of worker processes that each parse the stylesheet
+        once at startup. Failures (missing or corrupt badge PDF, rendering or
+        writing errors) are reported per sheet and don't stop the others.
+
+        Args:
+            jobs: (event, attendee, event_attendee, badge_pdf_path, output_path) per sheet
+            max_workers: Worker process count for PDF writing (default: os.cpu_count())
+
+        Returns:
+            (output_path, error) per job in input order; error is None on success
+        """
+        if not jobs:
+            return []
+
+        # Per-job error; a bad badge PDF only fails its own sheet
+        errors: list[Optional[str]] = [None] * len(jobs)
+        images = [None] * len(jobs)
+
+        if PYPDFIUM2_AVAILABLE:
+            for i, job in enumerate(jobs):
+                try:
+                    images[i] = _rasterize_first_page(job[3])
+                except Exception as e:
+                    errors[i] = str(e)
+        else:
+            # Merge the first page of every readable badge PDF and rasterize them together
+            merged = []
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                merged_path = Path(tmp_dir) / "badges.pdf"
+                writer = PdfWriter()
+                for i, job in enumerate(jobs):
+                    try:
+                        writer.append(str(job[3]), pages=(0, 1))
+                        merged.append(i)
+                    except Exception as e:
+                        errors[i] = str(e)
+                if merged:
+                    writer.write(str(merged_path))
+                    try:
+                        for i, image in zip(merged, convert_from_path(merged_path, dpi=BADGE_PREVIEW_DPI)):
+                            images[i] = image
+                    except Exception:
+                        # Poppler rejected the batch; fall back to one badge at a time
+                        for i in merged:
+                            try:
+                                images[i] = _rasterize_first_page(jobs[i][3])
+                            except Exception as e:
+                                errors[i] = str(e)
+                writer.close()
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sheet_worker,
+            initargs=(self._css_path,)
+        ) as executor:
+            futures = {}
+            for i, (event, attendee, event_attendee, _, output_path) in enumerate(jobs):
+                if errors[i] is not None:
+                    continue
+                try:
+                    badge_image_data = _image_to_data_uri(images[i])
+                    html_content = self._render_html(event, attendee, event_attendee, badge_image_data)
+                except Exception as e:
+                    errors[i] = str(e)
+                    continue
+                futures[i] = executor.submit(_write_sheet_pdf, html_content, self._css_path, output_path)
+
+            for i, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[i] = str(e)
+
+        return [(job[4], error) for job, error in zip(jobs, errors)]
+
+    def _render_html(
+        self,
+        event: Event,
+        attendee: Attendee,
+        event_attendee: EventAttendee,
+        badge_image_data: str
+    ) -> str:
+        """Render the sample sheet HTML for one attendee."""
         # Format data for display
         form_data = self._format_form_data(event, attendee, event_attendee)
 
-        # Load and render template
-        template = self.env.get_template("template.html")
-        html_content = template.render(
+        # Render the template compiled in __init__
+        return self._template.render(
             event=event,
             attendee=attendee,
             form_data=form_data,
@@ -72,42 +239,19 @@ class SampleSheetRenderer:
             generation_date=datetime.now().strftime("%B %d, %Y at %I:%M %p")
         )
 
-        # Generate PDF
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        css_path = self.template_dir / "styles.css"
-        HTML(string=html_content).write_pdf(
-            output_path,
-            stylesheets=[CSS(filename=str(css_path))]
-        )
-
-    def _pdf_to_base64_image(self, pdf_path: Path, dpi: int = 300) -> str:
+    def _pdf_to_base64_image(self, pdf_path: Path, dpi: int = BADGE_PREVIEW_DPI) -> str:
         """
         Convert a PDF to a base64-encoded PNG image.
 
         Args:
             pdf_path: Path to the PDF file
-            dpi: DPI for the output image (default 300 for print quality)
+            dpi: DPI for the output image (default 150, matched to the 3"x4" preview)
 
         Returns:
             Base64-encoded PNG image data as a data URI string
         """
-        # Convert PDF to PIL Image
-        images = convert_from_path(pdf_path, dpi=dpi)
-
         # Use the first page (badges are single-page)
-        image = images[0]
-
-        # Convert to PNG bytes
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        buffer.seek(0)
-
-        # Encode as base64
-        image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-
-        # Return as data URI
-        return f"data:image/png;base64,{image_base64}"
+        return _image_to_data_uri(_rasterize_first_page(pdf_path, dpi))
 
     def _format_form_data(
         self,
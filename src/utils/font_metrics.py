@@ -0,0 +1,99 @@
+"""
+Helvetica text measurement without reportlab.
+
+Widths are the standard Helvetica AFM advance widths (1000 units per em),
+indexed by Unicode code point for 0-255 (WinAnsi/Latin-1), plus the WinAnsi
+punctuation that lives outside Latin-1. Matches reportlab's
+pdfmetrics.stringWidth(text, "Helvetica", size) for those characters;
+helvetica_text_width defers to reportlab for anything else.
+"""
+import re
+
+# Code points 0-255; control characters have no advance width
+HELVETICA_WIDTHS = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    278, 333, 556, 556, 556, 556, 260, 556, 333, 737, 370, 556, 584, 333, 737, 333,
+    400, 584, 333, 333, 333, 556, 537, 278, 333, 333, 365, 556, 834, 834, 834, 611,
+    667, 667, 667, 667, 667, 667, 1000, 722, 667, 667, 667, 667, 278, 278, 278, 278,
+    722, 722, 778, 778, 778, 778, 778, 584, 778, 722, 722, 722, 722, 667, 667, 611,
+    556, 556, 556, 556, 556, 556, 889, 500, 556, 556, 556, 556, 278, 278, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 584, 611, 556, 556, 556, 556, 500, 556, 500,
+)
+
+# WinAnsi glyphs outside Latin-1 (smart quotes, dashes, ellipsis, ...)
+HELVETICA_EXTRA_WIDTHS = {
+    0x0152: 1000, 0x0153: 944, 0x0160: 667, 0x0161: 500, 0x0178: 667,
+    0x017D: 611, 0x017E: 500, 0x0192: 556, 0x02C6: 333, 0x02DC: 333,
+    0x2013: 556, 0x2014: 1000, 0x2018: 222, 0x2019: 222, 0x201A: 222,
+    0x201C: 333, 0x201D: 333, 0x201E: 333, 0x2020: 556, 0x2021: 556,
+    0x2022: 350, 0x2026: 1000, 0x2030: 1000, 0x2039: 333, 0x203A: 333,
+    0x20AC: 556, 0x2122: 1000,
+}
+
+# Width used for anything else (an average lowercase glyph)
+DEFAULT_WIDTH = 556
+
+# Any character the tables above don't cover
+_UNCOVERED_RE = re.compile(
+    '[^\\x00-\\xff' + ''.join(re.escape(chr(code)) for code in HELVETICA_EXTRA_WIDTHS) + ']'
+)
+
+
+def helvetica_covers(text: str) -> bool:
+    """True if every character of text has an exact width in the tables above."""
+    return _UNCOVERED_RE.search(text) is None
+
+
+def helvetica_width(text: str, font_size: float) -> float:
+    """
+    Measure text set in Helvetica.
+
+    Characters outside the tables are counted as DEFAULT_WIDTH; callers that
+    need exact widths for such text should check helvetica_covers first.
+
+    Args:
+        text: Text to measure
+        font_size: Font size in points
+
+    Returns:
+        Width in points
+    """
+    widths = HELVETICA_WIDTHS
+    total = 0
+    for c in text:
+        code = ord(c)
+        if code < 256:
+            total += widths[code]
+        else:
+            total += HELVETICA_EXTRA_WIDTHS.get(code, DEFAULT_WIDTH)
+    return total * font_size / 1000.0
+
+
+def helvetica_text_width(text: str, font_size: float) -> float:
+    """
+    Measure text set in Helvetica exactly.
+
+    Uses the tables above when they cover every character, and reportlab's
+    stringWidth otherwise (e.g. Cyrillic or CJK), so such text isn't
+    undercounted as DEFAULT_WIDTH.
+
+    Args:
+        text: Text to measure
+        font_size: Font size in points
+
+    Returns:
+        Width in points
+    """
+    if helvetica_covers(text):
+        return helvetica_width(text, font_size)
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    return stringWidth(text, "Helvetica", font_size)
@@ -2,28 +2,27 @@
 Name truncation utilities for badge generation.
 Provides clean API for intelligent name display with cultural awareness.
 """
+import math
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.units import inch
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedName:
-    """Structured representation of a parsed name."""
+    """Structured representation of a parsed name (immutable, so cached results can be shared)."""
     original: str
     first_name: str
     last_name: str
-    middle_names: List[str]
+    middle_names: tuple[str, ...] = ()
     patronymic: Optional[str] = None
-    connectors: List[str] = None
+    connectors: tuple[str, ...] = ()
     is_eastern_order: bool = False
 
-    def __post_init__(self):
-        if self.connectors is None:
-            self.connectors = []
-
 
 class _NameParser:
     """Internal class for parsing names with cultural awareness."""
@@ -33,24 +32,36 @@ class _NameParser:
     PATRONYMIC_ENDINGS = {'ovich', 'evich', 'ovna', 'evna', 'son', 'dóttir'}
     EASTERN_SURNAMES = {'Zhang', 'Wang', 'Li', 'Liu', 'Chen', 'Kim', 'Park', 'Lee'}
 
+    # Precompiled forms of the markers above for the per-token checks
+    # Tokens never contain spaces, so multi-word connectors ('de la') can't match one
+    _CONNECTOR_RE = re.compile(
+        '(?:' + '|'.join(sorted(c for c in CONNECTORS if ' ' not in c)) + ')',
+        re.IGNORECASE
+    )
+    _EASTERN_SURNAMES = frozenset(EASTERN_SURNAMES)
+    _PATRONYMIC_RE = re.compile(
+        '(?:' + '|'.join(sorted(PATRONYMIC_ENDINGS, key=len, reverse=True)) + ')$',
+        re.IGNORECASE
+    )
+
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse(cls, full_name: str) -> ParsedName:
-        """Parse a full name into structured components."""
+        """Parse a full name into structured components (cached)."""
         if not full_name or not full_name.strip():
             return ParsedName(
                 original=full_name,
                 first_name="",
-                last_name="",
-                middle_names=[]
+                last_name=""
             )
 
         # Normalize and tokenize
         tokens = full_name.strip().split()
 
         if len(tokens) == 0:
-            return ParsedName(original=full_name, first_name="", last_name="", middle_names=[])
+            return ParsedName(original=full_name, first_name="", last_name="")
         elif len(tokens) == 1:
-            return ParsedName(original=full_name, first_name=tokens[0], last_name="", middle_names=[])
+            return ParsedName(original=full_name, first_name=tokens[0], last_name="")
 
         # Detect name order
         is_eastern = cls._is_eastern_order(tokens)
@@ -63,7 +74,7 @@ class _NameParser:
     @classmethod
     def _is_eastern_order(cls, tokens: List[str]) -> bool:
         """Detect if name follows Eastern order (family name first)."""
-        if len(tokens) == 2 and tokens[0] in cls.EASTERN_SURNAMES:
+        if len(tokens) == 2 and tokens[0] in cls._EASTERN_SURNAMES:
             return True
         return False
 
@@ -74,7 +85,7 @@ class _NameParser:
             original=original,
             first_name=tokens[-1],  # Given name is last
             last_name=tokens[0],    # Family name is first
-            middle_names=tokens[1:-1] if len(tokens) > 2 else [],
+            middle_names=tuple(tokens[1:-1]),
             is_eastern_order=True
         )
 
@@ -85,31 +96,28 @@ class _NameParser:
         patronymic = None
         middle_names = []
 
-        # Identify connectors
-        connector_indices = []
-        for i, token in enumerate(tokens[1:-1], start=1):
-            if token.lower() in cls.CONNECTORS:
-                connectors.append(token)
-                connector_indices.append(i)
-
         # Identify patronymic (middle position, specific endings)
         if len(tokens) >= 3:
             middle_token = tokens[1] if len(tokens) == 3 else tokens[len(tokens) // 2]
-            if any(middle_token.lower().endswith(ending) for ending in cls.PATRONYMIC_ENDINGS):
+            if cls._PATRONYMIC_RE.search(middle_token):
                 patronymic = middle_token
 
-        # Middle names are everything between first and last, excluding connectors and patronymic
-        for i, token in enumerate(tokens[1:-1], start=1):
-            if i not in connector_indices and token != patronymic:
+        # Classify everything between first and last in one pass:
+        # connectors, then middle names (excluding the patronymic)
+        is_connector = cls._CONNECTOR_RE.fullmatch
+        for token in tokens[1:-1]:
+            if is_connector(token):
+                connectors.append(token)
+            elif token != patronymic:
                 middle_names.append(token)
 
         return ParsedName(
             original=original,
             first_name=tokens[0],
             last_name=tokens[-1],
-            middle_names=middle_names,
+            middle_names=tuple(middle_names),
             patronymic=patronymic,
-            connectors=connectors,
+            connectors=tuple(connectors),
             is_eastern_order=False
         )
 
@@ -125,6 +133,9 @@ class _NameTruncator:
         self.default_size = default_size
         self.min_size = min_size
 
+        # Resolve the font once; its stringWidth skips the registry lookup per measurement
+        self._font = pdfmetrics.getFont(font_name)
+
     def truncate(self, full_name: str) -> Dict[str, any]:
         """
         Progressively truncate name to fit constraints.
@@ -143,30 +154,55 @@ class _NameTruncator:
             return {"text": full_name, "font_size": self.default_size, "stage": 0}
 
         # Stage 2: Try shrinking
-        for size in range(int(self.default_size) - 1, int(self.min_size) - 1, -1):
-            if self._fits_at_size(full_name, float(size)):
-                return {"text": full_name, "font_size": float(size), "stage": 1}
+        size = self._largest_fitting_size(full_name)
+        if size is not None:
+            return {"text": full_name, "font_size": size, "stage": 1}
 
         # Stage 3: Progressive truncation
         parsed = _NameParser.parse(full_name)
         truncated = self._progressive_truncate(parsed)
 
         # Try shrinking truncated name
-        for size in range(int(self.default_size) - 1, int(self.min_size) - 1, -1):
-            if self._fits_at_size(truncated, float(size)):
-                return {"text": truncated, "font_size": float(size), "stage": 2}
+        size = self._largest_fitting_size(truncated)
+        if size is not None:
+            return {"text": truncated, "font_size": size, "stage": 2}
 
         # Last resort: use truncated name at minimum size
         return {"text": truncated, "font_size": self.min_size, "stage": 2}
 
     def _fits_at_size(self, text: str, size: float) -> bool:
         """Check if text fits within max width at given font size."""
-        width_pts = pdfmetrics.stringWidth(text, self.font_name, size)
+        width_pts = self._font.stringWidth(text, size)
         width_inches = width_pts / 72.0  # 72 points per inch
         # Add 8% safety margin to account for WeasyPrint PDF rendering differences
         safety_margin = 0.08 * self.max_width_inches
         return width_inches <= (self.max_width_inches - safety_margin)
 
+    def _largest_fitting_size(self, text: str) -> Optional[float]:
+        """
+        Largest whole font size below default_size (down to min_size) at which text fits.
+
+        String width is linear in font size, so the answer is solved directly from
+        the width at 1pt rather than by trying every size in turn.
+
+        Returns:
+            Font size as float, or None if text doesn't fit even at min_size
+        """
+        largest = int(self.default_size) - 1
+        smallest = int(self.min_size)
+        width_1pt = self._font.stringWidth(text, 1.0)
+        if width_1pt <= 0:
+            return float(largest) if largest >= smallest else None
+
+        # Same limit as _fits_at_size: max width less the 8% safety margin, in points
+        limit_pts = (self.max_width_inches - 0.08 * self.max_width_inches) * 72.0
+        size = min(largest, math.floor(limit_pts / width_1pt))
+
+        # Guard against float rounding right at the boundary
+        if size >= smallest and not self._fits_at_size(text, float(size)):
+            size -= 1
+        return float(size) if size >= smallest else None
+
     def _progressive_truncate(self, parsed: ParsedName) -> str:
         """Apply progressive truncation stages."""
         # Stage 3.1: Remove middle names
@@ -231,6 +267,21 @@ def get_display_name(original_name: str, max_width: float = 2.7,
             - font_size: Font size to use in points
             - truncated: Boolean indicating if truncation was applied
     """
+    text, font_size = _fit_display_name(
+        original_name, max_width, font_family, default_font_size, min_font_size
+    )
+
+    return {
+        "text": text,
+        "font_size": font_size,
+        "truncated": text != original_name
+    }
+
+
+@lru_cache(maxsize=4096)
+def _fit_display_name(original_name: str, max_width: float, font_family: str,
+                      default_font_size: float, min_font_size: float) -> tuple:
+    """Memoized truncation behind get_display_name; returns (text, font_size)."""
     truncator = _NameTruncator(
         max_width_inches=max_width,
         font_name=font_family,
@@ -239,9 +290,4 @@ def get_display_name(original_name: str, max_width: float = 2.7,
     )
 
     result = truncator.truncate(original_name)
-
-    return {
-        "text": result["text"],
-        "font_size": result["font_size"],
-        "truncated": result["text"] != original_name
-    }
+    return result["text"], result["font_size"]
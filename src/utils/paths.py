@@ -5,17 +5,24 @@ Works in both:
 - Local development (src/ at project root)
 - Azure deployment (src/ synced to function_app/)
 """
+from functools import lru_cache
 from pathlib import Path
 import os
+import sys
+import tempfile
 
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """
     Get project root - works in both local dev and Azure deployment.
 
     Detection logic:
     1. If PROJECT_ROOT env var set, use it (useful for testing/override)
-    2. Navigate up from this file to find the root containing src/
+    2. The directory above src/ (this file always lives at src/utils/paths.py)
+
+    The result is cached; call clear_project_root_cache() after changing
+    the PROJECT_ROOT env var.
 
     In local dev: /path/to/name-tag-gen/
     In Azure: /home/site/wwwroot/ (function_app contents)
@@ -25,84 +32,194 @@ def get_project_root() -> Path:
         return Path(env_root)
 
     # Start from this file's location: src/utils/paths.py
-    current = Path(__file__).resolve().parent  # src/utils/
+    # (abspath, not resolve(): an absolute path is enough and needs no readlink calls)
+    current = Path(os.path.dirname(os.path.abspath(__file__)))  # src/utils/
 
     # Go up to src/, then one more to get project root
     src_dir = current.parent  # src/
     project_root = src_dir.parent  # function_app/ or name-tag-gen/
 
-    # Verify we found a valid root (has src/ directory)
-    if (project_root / "src").exists():
-        return project_root
-
-    # Fallback: search upward for a directory containing src/
-    for parent in current.parents:
-        if (parent / "src").exists():
-            return parent
-
-    raise RuntimeError(
+    # The file's place in the package fixes the layout, so the src/ check is a
+    # development-time sanity check only (stripped under python -O)
+    assert os.path.isdir(os.path.join(project_root, "src")), (
         "Could not determine project root. "
         "Set PROJECT_ROOT environment variable or ensure src/ directory exists."
     )
+    return project_root
+
+
+def clear_project_root_cache() -> None:
+    """Forget the cached project root (and every path derived from it) so the next access re-detects it."""
+    for cached in (get_project_root, _project_dir, _project_dir_str, _output_root,
+                   _output_subdir):
+        cached.cache_clear()
+    for name in _LAZY_ATTRS:
+        globals().pop(name, None)
+
 
+@lru_cache(maxsize=None)
+def _project_dir(name: str) -> Path:
+    """A fixed directory under the project root."""
+    return get_project_root() / name
 
-# Module-level constant for convenience
-PROJECT_ROOT = get_project_root()
+
+@lru_cache(maxsize=None)
+def _project_dir_str(name: str) -> str:
+    """String form of _project_dir, for os.path.join / f-string call sites."""
+    return str(_project_dir(name))
 
 
 def get_config_dir() -> Path:
     """Get the config directory (badge templates, HTML templates)."""
-    return PROJECT_ROOT / "config"
+    return _project_dir("config")
 
 
 def get_mocks_dir() -> Path:
     """Get the mocks directory (event and attendee JSON data)."""
-    return PROJECT_ROOT / "mocks"
+    return _project_dir("mocks")
 
 
 def get_assets_dir() -> Path:
     """Get the assets directory (event logos, sponsor logos, icons)."""
-    return PROJECT_ROOT / "assets"
+    return _project_dir("assets")
 
 
 def get_data_dir() -> Path:
     """Get the data directory (Natural Earth shapefiles)."""
-    return PROJECT_ROOT / "data"
+    return _project_dir("data")
+
+
+def get_config_dir_str() -> str:
+    """Get the config directory as a string."""
+    return _project_dir_str("config")
+
+
+def get_mocks_dir_str() -> str:
+    """Get the mocks directory as a string."""
+    return _project_dir_str("mocks")
+
+
+def get_assets_dir_str() -> str:
+    """Get the assets directory as a string."""
+    return _project_dir_str("assets")
+
+
+def get_data_dir_str() -> str:
+    """Get the data directory as a string."""
+    return _project_dir_str("data")
+
+
+def config_path(*parts: str) -> Path:
+    """Path to a file under the config directory (joined as strings, one Path built)."""
+    return Path(os.path.join(_project_dir_str("config"), *parts))
+
+
+def mocks_path(*parts: str) -> Path:
+    """Path to a file under the mocks directory (joined as strings, one Path built)."""
+    return Path(os.path.join(_project_dir_str("mocks"), *parts))
+
+
+def assets_path(*parts: str) -> Path:
+    """Path to a file under the assets directory (joined as strings, one Path built)."""
+    return Path(os.path.join(_project_dir_str("assets"), *parts))
+
+
+def data_path(*parts: str) -> Path:
+    """Path to a file under the data directory (joined as strings, one Path built)."""
+    return Path(os.path.join(_project_dir_str("data"), *parts))
 
 
+# Directories already created by this process, keyed by interned path string
+# (mkdir is issued once per path)
+_created_dirs: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) the first time it is requested in this process."""
+    key = sys.intern(os.fspath(path))
+    if key not in _created_dirs:
+        # Parents usually exist already (output tree is created up front), so try
+        # a single mkdir before falling back to the recursive ancestor walk
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
+        _created_dirs.add(key)
+    return path
+
+
+# Azure Functions sets various environment variables
+_AZURE_INDICATORS = frozenset({
+    'WEBSITE_INSTANCE_ID',          # Primary Azure indicator
+    'AZURE_FUNCTIONS_ENVIRONMENT',  # Functions-specific
+    'FUNCTIONS_WORKER_RUNTIME',     # Functions runtime
+    'WEBSITE_SITE_NAME',            # Azure App Service/Functions
+})
+
+
+@lru_cache(maxsize=None)
 def _is_azure_environment() -> bool:
     """Check if we're running in Azure/production environment.
 
     Primary check: ENVIRONMENT=prod (explicit, reliable)
     Fallback: Azure-specific environment variables
+
+    Cached: the environment does not change during a process lifetime.
     """
-    # Explicit environment flag (most reliable)
-    if os.getenv('ENVIRONMENT') == 'prod':
-        return True
+    # Explicit environment flag (most reliable), then any Azure indicator variable
+    return os.environ.get('ENVIRONMENT') == 'prod' or not _AZURE_INDICATORS.isdisjoint(os.environ)
+
+
+@lru_cache(maxsize=None)
+def _output_root() -> tuple[Path, str]:
+    """Output root as (Path, interned string)."""
+    # Azure Functions has a writable local temp directory (/tmp on Linux, %TEMP% on
+    # Windows hosts); locally output lives in the project
+    if _is_azure_environment():
+        root = Path(tempfile.gettempdir()) / "badge_output"
+    else:
+        root = get_project_root() / "output"
+    return root, sys.intern(str(root))
 
-    # Fallback: Azure Functions sets various environment variables
-    azure_indicators = [
-        'WEBSITE_INSTANCE_ID',          # Primary Azure indicator
-        'AZURE_FUNCTIONS_ENVIRONMENT',  # Functions-specific
-        'FUNCTIONS_WORKER_RUNTIME',     # Functions runtime
-        'WEBSITE_SITE_NAME',            # Azure App Service/Functions
-    ]
-    return any(os.getenv(var) is not None for var in azure_indicators)
+
+# Standard subdirectories, created together with the output root
+_OUTPUT_SUBDIRS = ("working", "badges", "location_graphics")
+
+
+def _ensure_output_dirs() -> None:
+    """Create the output root and its standard subdirectories in one batch (once per process)."""
+    root, root_str = _output_root()
+    if root_str in _created_dirs:
+        return
+    for name in _OUTPUT_SUBDIRS:
+        _ensure_dir(root / name)
+    _created_dirs.add(root_str)
 
 
 def get_output_dir() -> Path:
     """Get the output directory (generated badges, working files).
 
-    In Azure: Uses /tmp which is writable
+    In Azure: Uses <temp dir>/badge_output, which is writable
     Locally: Uses PROJECT_ROOT/output
+
+    The first call also creates working/, badges/ and location_graphics/.
     """
-    if _is_azure_environment():
-        # Azure Functions has writable /tmp directory
-        output = Path("/tmp/badge_output")
-    else:
-        output = PROJECT_ROOT / "output"
-    output.mkdir(exist_ok=True)
-    return output
+    _ensure_output_dirs()
+    return _output_root()[0]
+
+
+@lru_cache(maxsize=1024)
+def _output_subdir(*parts: str) -> Path:
+    """
+    Directory under the output root, created on first request (cached per path).
+
+    The first part is one of the standard subdirectories; the rest are
+    event/user IDs. Joined as strings and built into a single Path.
+    """
+    _ensure_output_dirs()
+    return _ensure_dir(Path(os.path.join(_output_root()[1], *parts)))
 
 
 def get_working_dir(event_id: str = None, user_id: str = None) -> Path:
@@ -116,13 +233,11 @@ def get_working_dir(event_id: str = None, user_id: str = None) -> Path:
     Returns:
         Path to working directory
     """
-    working = get_output_dir() / "working"
-    if event_id:
-        working = working / event_id
-        if user_id:
-            working = working / user_id
-    working.mkdir(parents=True, exist_ok=True)
-    return working
+    if not event_id:
+        return _output_subdir("working")
+    if not user_id:
+        return _output_subdir("working", event_id)
+    return _output_subdir("working", event_id, user_id)
 
 
 def get_badges_dir(event_id: str = None) -> Path:
@@ -135,15 +250,36 @@ def get_badges_dir(event_id: str = None) -> Path:
     Returns:
         Path to badges directory
     """
-    badges = get_output_dir() / "badges"
-    if event_id:
-        badges = badges / event_id
-    badges.mkdir(parents=True, exist_ok=True)
-    return badges
+    if not event_id:
+        return _output_subdir("badges")
+    return _output_subdir("badges", event_id)
 
 
 def get_location_graphics_dir() -> Path:
     """Get directory for cached location graphics."""
-    location_dir = get_output_dir() / "location_graphics"
-    location_dir.mkdir(parents=True, exist_ok=True)
-    return location_dir
+    return _output_subdir("location_graphics")
+
+
+# Module constants resolved on first access (PEP 562), so importing this module
+# does no filesystem work; `from src.utils.paths import PROJECT_ROOT` still works
+_LAZY_ATTRS = {
+    'PROJECT_ROOT': get_project_root,
+    'CONFIG_DIR': get_config_dir,
+    'MOCKS_DIR': get_mocks_dir,
+    'ASSETS_DIR': get_assets_dir,
+    'DATA_DIR': get_data_dir,
+    'CONFIG_DIR_STR': get_config_dir_str,
+    'MOCKS_DIR_STR': get_mocks_dir_str,
+    'ASSETS_DIR_STR': get_assets_dir_str,
+    'DATA_DIR_STR': get_data_dir_str,
+}
+
+
+def __getattr__(name: str):
+    """Resolve a _LAZY_ATTRS constant on first access and keep it as a module global."""
+    factory = _LAZY_ATTRS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value
+    return value